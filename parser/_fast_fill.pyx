@@ -0,0 +1,60 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled version of the event column-fill loop used by
+EventsDataParser.parse_events_and_qualifiers.
+
+Optional: build in place with
+
+    cythonize -i parser/_fast_fill.pyx
+
+parse_events falls back to the pure-Python loop when this extension has
+not been built.
+"""
+
+
+cpdef fill_event_columns(
+    object events,
+    list ev_ids,
+    list ev_type_ids,
+    list ev_period_ids,
+    list ev_minutes,
+    list ev_seconds,
+    list ev_team_ids,
+    list ev_player_ids,
+    list ev_player_names,
+    list ev_outcomes,
+    list ev_xs,
+    list ev_ys,
+    list ev_timestamps,
+    list q_counts,
+    list q_ids,
+    list q_values,
+):
+    cdef dict raw_event
+    cdef dict qualifier
+    cdef object _id
+    cdef object quals
+
+    for raw_event in events:
+        _id = raw_event.get("id")
+        ev_ids.append(_id)
+        ev_type_ids.append(raw_event.get("typeId"))
+        ev_period_ids.append(raw_event.get("periodId"))
+        ev_minutes.append(raw_event.get("timeMin"))
+        ev_seconds.append(raw_event.get("timeSec"))
+        ev_team_ids.append(raw_event.get("contestantId"))
+        ev_player_ids.append(raw_event.get("playerId"))
+        ev_player_names.append(raw_event.get("playerName"))
+        ev_outcomes.append(raw_event.get("outcome"))
+        ev_xs.append(raw_event.get("x"))
+        ev_ys.append(raw_event.get("y"))
+        ev_timestamps.append(raw_event.get("timeStamp"))
+
+        quals = raw_event.get("qualifier")
+        if quals is None:
+            q_counts.append(0)
+            continue
+        q_counts.append(len(<list> quals))
+        for qualifier in <list> quals:
+            q_ids.append(qualifier.get("qualifierId"))
+            q_values.append(qualifier.get("value"))
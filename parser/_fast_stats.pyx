@@ -0,0 +1,52 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled version of the per-player stat column-fill loop used by
+StatsParser.parse_to_arrow.
+
+Optional: build in place with
+
+    cythonize -i parser/_fast_stats.pyx
+
+parse_stats falls back to the pure-Python loop when this extension has
+not been built.
+"""
+
+
+cpdef fill_stat_columns(
+    list lineup_array,
+    dict teams,
+    list team_ids,
+    list player_ids,
+    list match_names,
+    list shirt_numbers,
+    list positions,
+    dict stat_cols,
+    dict stat_numeric,
+):
+    cdef dict team_data
+    cdef dict player
+    cdef dict stat
+    cdef object team_id
+    cdef object stat_type
+    cdef object value
+    cdef Py_ssize_t i = 0
+
+    for team_data in lineup_array:
+        team_id = team_data.get("contestantId")
+        teams[team_id] = team_data
+
+        for player in <list> team_data.get("player", []):
+            team_ids[i] = team_id
+            player_ids[i] = player.get("playerId")
+            match_names[i] = player.get("matchName")
+            shirt_numbers[i] = player.get("shirtNumber")
+            positions[i] = player.get("position")
+
+            for stat in <list> player.get("stat", []):
+                stat_type = stat.get("type")
+                value = stat.get("value")
+                if value is not None and not isinstance(value, (int, float)):
+                    stat_numeric[stat_type] = False
+                (<list> stat_cols[stat_type])[i] = value
+
+            i += 1
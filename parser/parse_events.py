@@ -1,17 +1,147 @@
-import json
+import ijson
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import logging
+import os
 from .references import *
 
+try:
+    import simdjson
+
+    # One reusable parser amortizes its buffer allocation across files
+    _SIMDJSON_PARSER = simdjson.Parser()
+except ImportError:
+    _SIMDJSON_PARSER = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format="%(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
+# Keep the narrow nullable integer dtypes when materializing pandas views
+# of the Arrow tables (plain to_pandas would widen nullable ints to float64)
+_ARROW_TO_PANDAS_DTYPES = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+}
+
+# Shared parquet write settings for every write_to_dataset call: ZSTD with
+# dictionary encoding compresses the low-cardinality event/qualifier
+# columns far better than the defaults, and bounded data pages keep
+# filtered reads cheap (the dataset writer sizes row groups itself)
+_PARQUET_WRITE_KWARGS = dict(
+    compression="zstd",
+    use_dictionary=True,
+    data_page_size=1 << 20,
+)
+
+
+def _as_arrow_table(data) -> pa.Table:
+    if isinstance(data, pa.Table):
+        return data
+    return pa.Table.from_pandas(data, preserve_index=False)
+
+
+def _decode_dictionary_columns(tbl: pa.Table) -> pa.Table:
+    # Hive partition columns come back dictionary-encoded from read_table
+    # while the pre-partition flat files hold plain values; decode to the
+    # value type so the two schemas can actually merge
+    for i, field in enumerate(tbl.schema):
+        if pa.types.is_dictionary(field.type):
+            tbl = tbl.set_column(
+                i, field.name, tbl.column(i).cast(field.type.value_type)
+            )
+    return tbl
+
+
+def _fill_event_columns_py(
+    events,
+    ev_ids,
+    ev_type_ids,
+    ev_period_ids,
+    ev_minutes,
+    ev_seconds,
+    ev_team_ids,
+    ev_player_ids,
+    ev_player_names,
+    ev_outcomes,
+    ev_xs,
+    ev_ys,
+    ev_timestamps,
+    q_counts,
+    q_ids,
+    q_values,
+) -> None:
+    # Bind the append methods as locals to avoid LOAD_ATTR in the hot loop
+    ev_id_append = ev_ids.append
+    ev_type_id_append = ev_type_ids.append
+    ev_period_append = ev_period_ids.append
+    ev_minute_append = ev_minutes.append
+    ev_second_append = ev_seconds.append
+    ev_team_append = ev_team_ids.append
+    ev_player_id_append = ev_player_ids.append
+    ev_player_name_append = ev_player_names.append
+    ev_outcome_append = ev_outcomes.append
+    ev_x_append = ev_xs.append
+    ev_y_append = ev_ys.append
+    ev_timestamp_append = ev_timestamps.append
+
+    q_count_append = q_counts.append
+    q_id_extend = q_ids.extend
+    q_value_extend = q_values.extend
+
+    # Unbound dict.get as a local: LOAD_FAST + one call instead of a
+    # LOAD_METHOD per field per event
+    _get = dict.get
+
+    for raw_event in events:
+        _id = _get(raw_event, "id")
+        ev_id_append(_id)
+        ev_type_id_append(_get(raw_event, "typeId"))
+        ev_period_append(_get(raw_event, "periodId"))
+        ev_minute_append(_get(raw_event, "timeMin"))
+        ev_second_append(_get(raw_event, "timeSec"))
+        ev_team_append(_get(raw_event, "contestantId"))
+        ev_player_id_append(_get(raw_event, "playerId", None))
+        ev_player_name_append(_get(raw_event, "playerName", None))
+        ev_outcome_append(_get(raw_event, "outcome"))
+        ev_x_append(_get(raw_event, "x"))
+        ev_y_append(_get(raw_event, "y"))
+        ev_timestamp_append(_get(raw_event, "timeStamp"))
+
+        # Flatten qualifiers and only remember how many each event had;
+        # the event_id column is produced in one np.repeat after the loop
+        # instead of appending the id string once per qualifier
+        quals = _get(raw_event, "qualifier") or ()
+        q_count_append(len(quals))
+        q_id_extend(_get(q, "qualifierId") for q in quals)
+        q_value_extend(_get(q, "value") for q in quals)
+
+
+try:
+    # Compiled version of the fill loop (see _fast_fill.pyx); build with
+    # `cythonize -i parser/_fast_fill.pyx` to remove the interpreter
+    # dispatch per event
+    from ._fast_fill import fill_event_columns as _fill_event_columns
+except ImportError:
+    _fill_event_columns = _fill_event_columns_py
+
+
+def _fill_unknown(names: pd.Series, ids: pd.Series) -> pd.Series:
+    # Vectorized equivalent of the f"Unknown (ID: {id})" fallback
+    missing = names.isna()
+    if missing.any():
+        names[missing] = "Unknown (ID: " + ids[missing].astype(str) + ")"
+    return names
+
+
 class EventsDataParser:
 
     def __init__(
@@ -20,8 +150,10 @@ class EventsDataParser:
         file_path: str | None = None,
     ):
         self.raw_data: Dict = None
-        self.df_events = None
-        self.df_qualifiers = None
+        self.tbl_events: Optional[pa.Table] = None
+        self.tbl_qualifiers: Optional[pa.Table] = None
+        self._df_events = None
+        self._df_qualifiers = None
         self.df_metadata = None
         self.match_metadata = {}
 
@@ -29,19 +161,79 @@ class EventsDataParser:
             self.file_path = Path(file_path)
             self.load_json()
         else:
+            self.file_path = None
             self.raw_data = event_data_object
             self.extract_match_metadata()
 
-    def load_json(self) -> None:
-        logger.info(f"Loading JSON from {self.file_path}")
+    def _open_stream(self):
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                self.raw_data = json.load(f)
-            logger.info("JSON loaded successfully")
+            f = open(self.file_path, "rb")
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {self.file_path}")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON: {e}")
+        if hasattr(os, "posix_fadvise"):
+            # Match files are always read front to back; telling the kernel
+            # lets it prefetch aggressively so parsing overlaps with I/O,
+            # which matters when parse_many churns through hundreds of files
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return f
+
+    def load_json(self) -> None:
+        # Only the small header sub-objects (`matchInfo`, `matchDetails`) are
+        # materialized here; the large `liveData.event` array is streamed
+        # lazily by _iter_events() so only one event dict is alive at a time
+        logger.info(f"Loading JSON header from {self.file_path}")
+        if _SIMDJSON_PARSER is not None:
+            # JSON Pointer lookups on the simdjson tape index straight into
+            # the raw bytes; only the two header branches are materialized
+            with self._open_stream() as f:
+                buf = f.read()
+            try:
+                doc = _SIMDJSON_PARSER.parse(buf)
+            except ValueError as e:
+                raise ValueError(f"Invalid JSON: {e}")
+            try:
+                match_info = doc.at_pointer("/matchInfo").as_dict()
+            except KeyError:
+                match_info = None
+            try:
+                match_details = doc.at_pointer("/liveData/matchDetails").as_dict()
+            except KeyError:
+                match_details = None
+            # Release the document so the shared parser can be reused
+            del doc
+        else:
+            try:
+                with self._open_stream() as f:
+                    match_info = next(ijson.items(f, "matchInfo"), None)
+                with self._open_stream() as f:
+                    match_details = next(
+                        ijson.items(f, "liveData.matchDetails"), None
+                    )
+            except ijson.JSONError as e:
+                raise ValueError(f"Invalid JSON: {e}")
+
+        self.raw_data = {}
+        if match_info is not None:
+            self.raw_data["matchInfo"] = match_info
+        if match_details is not None:
+            self.raw_data["liveData"] = {"matchDetails": match_details}
+        logger.info("JSON header loaded successfully")
+
+    def _iter_events(self):
+        if (
+            self.raw_data is not None
+            and "liveData" in self.raw_data
+            and "event" in self.raw_data["liveData"]
+        ):
+            yield from self.raw_data["liveData"]["event"]
+        elif self.file_path is not None:
+            logger.info(f"Streaming events from {self.file_path}")
+            with self._open_stream() as f:
+                # use_float keeps x/y as floats instead of Decimal so they
+                # drop straight into the float32 Arrow columns
+                yield from ijson.items(f, "liveData.event.item", use_float=True)
+        else:
+            raise ValueError("Unable to locate events in JSON structure")
 
     def extract_match_metadata(self) -> Dict[str, Any]:
         logger.info("Extracting match metadata")
@@ -54,6 +246,10 @@ class EventsDataParser:
                 metadata["local_date"] = match_info.get("localDate", "")
                 metadata["local_time"] = match_info.get("localTime", "")
                 metadata["match_week"] = match_info.get("week", "")
+                # Partition columns for the metadata dataset; they must
+                # exist even when the feed omits the parent objects
+                metadata["competition_code"] = ""
+                metadata["season"] = ""
 
                 if "competition" in match_info:
                     metadata["competition_id"] = match_info["competition"].get("id", "")
@@ -128,151 +324,310 @@ class EventsDataParser:
         return df_metadata
 
     def parse_events_and_qualifiers(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        if "liveData" in self.raw_data and "event" in self.raw_data["liveData"]:
-            self.events_raw = self.raw_data["liveData"]["event"]
-            logger.info(f"Extracted {len(self.events_raw)} raw events")
-        else:
-            raise ValueError("Unable to locate events in JSON structure")
-
         logger.info("Parsing events and qualifiers into separate DataFrames")
-        events_list = []
-        qualifiers_list = []
-
-        for raw_event in self.events_raw:
-            _id = raw_event.get("id")
-
-            event_record = {
-                "id": _id,
-                "match_id": self.match_metadata["match_id"],
-                "type_id": raw_event.get("typeId"),
-                "type_name": OptaEventTypeReference.get_type_name(
-                    raw_event.get("typeId")
-                ),
-                "period_id": raw_event.get("periodId"),
-                "minute": raw_event.get("timeMin"),
-                "second": raw_event.get("timeSec"),
-                "team_id": raw_event.get("contestantId"),
-                "player_id": raw_event.get("playerId", None),
-                "player_name": raw_event.get("playerName", None),
-                "outcome": raw_event.get("outcome"),
-                "x": raw_event.get("x"),
-                "y": raw_event.get("y"),
-                "timestamp": raw_event.get("timeStamp"),
+
+        # Structure-of-arrays buffers: one list per column. Building the
+        # DataFrame from a dict of columns hits pandas' fast constructor path
+        # instead of the slow list-of-dicts transpose/inference path
+        ev_ids = []
+        ev_type_ids = []
+        ev_period_ids = []
+        ev_minutes = []
+        ev_seconds = []
+        ev_team_ids = []
+        ev_player_ids = []
+        ev_player_names = []
+        ev_outcomes = []
+        ev_xs = []
+        ev_ys = []
+        ev_timestamps = []
+
+        q_counts = []
+        q_ids = []
+        q_values = []
+
+        _fill_event_columns(
+            self._iter_events(),
+            ev_ids,
+            ev_type_ids,
+            ev_period_ids,
+            ev_minutes,
+            ev_seconds,
+            ev_team_ids,
+            ev_player_ids,
+            ev_player_names,
+            ev_outcomes,
+            ev_xs,
+            ev_ys,
+            ev_timestamps,
+            q_counts,
+            q_ids,
+            q_values,
+        )
+
+        # One vectorized C-level map per column replaces a Python lookup call
+        # per event/qualifier
+        ev_type_id_series = pd.Series(ev_type_ids)
+        ev_type_names = _fill_unknown(
+            ev_type_id_series.map(OptaEventTypeReference.TYPE_NAMES),
+            ev_type_id_series,
+        )
+        q_id_series = pd.Series(q_ids)
+        q_names = _fill_unknown(
+            q_id_series.map(OptaQualifierReference.QUALIFIER_NAMES), q_id_series
+        )
+        q_descs = q_id_series.map(
+            OptaQualifierReference.QUALIFIER_DESCRIPTIONS
+        ).fillna("No description")
+
+        # The match id is a single value repeated on every row; a categorical
+        # with one category and an int8 codes array stores it in O(1) instead
+        # of N string references
+        match_id_col = pd.Categorical.from_codes(
+            np.zeros(len(ev_ids), dtype=np.int8),
+            categories=[self.match_metadata["match_id"]],
+        )
+        # Opta timestamps normally carry milliseconds; the literal format
+        # string keeps pandas on the C parsing fast path and the cache
+        # dedupes repeated timestamps (several events per second). Some
+        # feeds omit the fractional part, so fall back to the general
+        # ISO8601 parser rather than coercing those rows to NaT
+        try:
+            ev_timestamps = pd.to_datetime(
+                ev_timestamps,
+                format="%Y-%m-%dT%H:%M:%S.%fZ",
+                utc=True,
+                cache=True,
+            )
+        except ValueError:
+            ev_timestamps = pd.to_datetime(
+                ev_timestamps, format="ISO8601", utc=True, cache=True
+            )
+
+        # Build Arrow tables straight from the column buffers: no BlockManager,
+        # no per-column inference. The dtype choices from the DataFrame days
+        # survive as the Arrow schema (narrow ints, float32 coordinates,
+        # dictionary encoding for the low-cardinality string columns). The
+        # pandas views are materialized lazily by the df_events/df_qualifiers
+        # properties only when a caller asks for them
+        dict_str = pa.dictionary(pa.int32(), pa.string())
+        self.tbl_events = pa.table(
+            {
+                "id": pa.array(ev_ids, type=pa.int64()),
+                "match_id": pa.array(match_id_col),
+                "type_id": pa.array(ev_type_ids, type=pa.int16()),
+                "type_name": pa.array(ev_type_names, type=dict_str),
+                "period_id": pa.array(ev_period_ids, type=pa.int8()),
+                "minute": pa.array(ev_minutes, type=pa.int16()),
+                "second": pa.array(ev_seconds, type=pa.int16()),
+                "team_id": pa.array(ev_team_ids, type=dict_str),
+                "player_id": pa.array(ev_player_ids, type=dict_str),
+                "player_name": pa.array(ev_player_names, type=dict_str),
+                "outcome": pa.array(ev_outcomes, type=pa.int8()),
+                "x": pa.array(ev_xs, type=pa.float32()),
+                "y": pa.array(ev_ys, type=pa.float32()),
+                "timestamp": pa.array(ev_timestamps),
+            }
+        )
+        q_event_ids = np.repeat(np.asarray(ev_ids, dtype=object), q_counts)
+        # Same single-category trick as the events table: qualifiers need
+        # their own match_id so the dataset can replace a re-ingested
+        # match's partition in lockstep with the events one
+        q_match_id_col = pd.Categorical.from_codes(
+            np.zeros(len(q_ids), dtype=np.int8),
+            categories=[self.match_metadata["match_id"]],
+        )
+        self.tbl_qualifiers = pa.table(
+            {
+                "event_id": pa.array(q_event_ids, type=pa.int64()),
+                "match_id": pa.array(q_match_id_col),
+                "qualifier_id": pa.array(q_ids, type=pa.int16()),
+                "qualifier_name": pa.array(q_names, type=dict_str),
+                "qualifier_desc": pa.array(q_descs, type=dict_str),
+                "value": pa.array(q_values, type=pa.string()),
             }
-            events_list.append(event_record)
-
-            for qualifier in raw_event.get("qualifier", []):
-                qual_id = qualifier.get("qualifierId")
-                qual_value = qualifier.get("value")
-                qualifier_record = {
-                    "event_id": _id,
-                    "qualifier_id": qual_id,
-                    "qualifier_name": OptaQualifierReference.get_qualifier_name(
-                        qual_id
-                    ),
-                    "qualifier_desc": OptaQualifierReference.get_qualifier_description(
-                        qual_id
-                    ),
-                    "value": qual_value,
-                }
-                qualifiers_list.append(qualifier_record)
-
-        self.df_events = pd.DataFrame(events_list)
-        self.df_events["timestamp"] = pd.to_datetime(
-            self.df_events["timestamp"], format="ISO8601"
         )
-        self.df_qualifiers = pd.DataFrame(qualifiers_list)
+        self._df_events = None
+        self._df_qualifiers = None
 
-        logger.info(f"Created df_events: {self.df_events.shape}")
-        logger.info(f"Created df_qualifiers: {self.df_qualifiers.shape}")
+        logger.info(f"Created tbl_events: {self.tbl_events.shape}")
+        logger.info(f"Created tbl_qualifiers: {self.tbl_qualifiers.shape}")
         return self.df_events, self.df_qualifiers
 
+    @property
+    def df_events(self) -> Optional[pd.DataFrame]:
+        if self._df_events is None and self.tbl_events is not None:
+            self._df_events = self.tbl_events.to_pandas(
+                types_mapper=_ARROW_TO_PANDAS_DTYPES.get, split_blocks=True
+            )
+        return self._df_events
+
+    @property
+    def df_qualifiers(self) -> Optional[pd.DataFrame]:
+        if self._df_qualifiers is None and self.tbl_qualifiers is not None:
+            self._df_qualifiers = self.tbl_qualifiers.to_pandas(
+                types_mapper=_ARROW_TO_PANDAS_DTYPES.get, split_blocks=True
+            )
+        return self._df_qualifiers
+
+    @classmethod
+    def parse_many(
+        cls, paths: List[str], workers: Optional[int] = None
+    ) -> Tuple[pa.Table, pa.Table]:
+        """
+        Parse many match files in parallel (one process per core by default)
+        and return the concatenated events/qualifiers Arrow tables. Matches
+        are independent, so this scales near-linearly with cores.
+        """
+        logger.info(f"Parsing {len(paths)} match files across processes")
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_parse_one_to_arrow, paths, chunksize=8))
+        tbl_events = pa.concat_tables(events for events, _ in results)
+        tbl_qualifiers = pa.concat_tables(quals for _, quals in results)
+        logger.info(
+            f"Parsed {tbl_events.num_rows} events / "
+            f"{tbl_qualifiers.num_rows} qualifiers"
+        )
+        return tbl_events, tbl_qualifiers
+
     @staticmethod
     def load_or_append_metadata(
         df_metadata: pd.DataFrame = None, output_dir: str = "data/match-events"
     ) -> pd.DataFrame:
-        parquet_path = Path(output_dir) / "metadata.parquet"
+        dataset_root = Path(output_dir) / "metadata"
+        legacy_path = Path(output_dir) / "metadata.parquet"
 
         if df_metadata is None:
-            if parquet_path.exists():
-                logger.info(f"Loading metadata parquet: {parquet_path}")
-                df_result = pd.read_parquet(parquet_path)
-                logger.info(f"Loaded metadata with {len(df_result)} rows")
-                return df_result
-            else:
-                logger.error(f"No metadata parquet found at: {parquet_path}")
-                raise FileNotFoundError(f"Parquet file not found: {parquet_path}")
-        else:
-            parquet_path.parent.mkdir(parents=True, exist_ok=True)
-            if parquet_path.exists():
-                logger.info(f"Loading existing metadata parquet: {parquet_path}")
-                df_existing = pd.read_parquet(parquet_path)
-                df_combined = pd.concat([df_existing, df_metadata], ignore_index=True)
-                logger.info(f"Appended new metadata. Total rows: {len(df_combined)}")
-            else:
-                logger.info(f"Creating new metadata parquet: {parquet_path}")
-                df_combined = df_metadata
+            return EventsDataParser._read_dataset(
+                dataset_root, legacy_path, "metadata", dedupe_col="match_id"
+            )
 
-            df_combined.to_parquet(parquet_path, index=False)
-            logger.info(f"Saved metadata parquet with {len(df_combined)} rows")
-            return df_combined
+        # One row per match: appending writes a single small file under its
+        # competition/season partition instead of re-reading and rewriting
+        # the whole history; the string-heavy columns stay dictionary-encoded
+        tbl = _as_arrow_table(df_metadata)
+        dataset_root.mkdir(parents=True, exist_ok=True)
+        pq.write_to_dataset(
+            tbl,
+            root_path=dataset_root,
+            partition_cols=["competition_code", "season"],
+            **_PARQUET_WRITE_KWARGS,
+        )
+        logger.info(f"Appended {tbl.num_rows} metadata rows to {dataset_root}")
+        return (
+            df_metadata if isinstance(df_metadata, pd.DataFrame) else tbl.to_pandas()
+        )
 
     @staticmethod
     def load_or_append_events(
         df_events: pd.DataFrame = None, output_dir: str = "data/match-events"
     ) -> pd.DataFrame:
-        parquet_path = Path(output_dir) / "events.parquet"
+        dataset_root = Path(output_dir) / "events"
+        legacy_path = Path(output_dir) / "events.parquet"
 
         if df_events is None:
-            if parquet_path.exists():
-                logger.info(f"Loading events parquet: {parquet_path}")
-                df_result = pd.read_parquet(parquet_path)
-                logger.info(f"Loaded events with {len(df_result)} rows")
-                return df_result
-            else:
-                logger.error(f"No events parquet found at: {parquet_path}")
-                raise FileNotFoundError(f"Parquet file not found: {parquet_path}")
-        else:
-            parquet_path.parent.mkdir(parents=True, exist_ok=True)
-            if parquet_path.exists():
-                logger.info(f"Loading existing events parquet: {parquet_path}")
-                df_existing = pd.read_parquet(parquet_path)
-                df_combined = pd.concat([df_existing, df_events], ignore_index=True)
-                logger.info(f"Appended new events. Total rows: {len(df_combined)}")
-            else:
-                logger.info(f"Creating new events parquet: {parquet_path}")
-                df_combined = df_events
+            return EventsDataParser._read_dataset(
+                dataset_root, legacy_path, "events", dedupe_col="match_id"
+            )
 
-            df_combined.to_parquet(parquet_path, index=False)
-            logger.info(f"Saved events parquet with {len(df_combined)} rows")
-            return df_combined
+        # Appending a match writes only its own partition; re-ingesting the
+        # same match replaces that partition instead of rewriting the history
+        tbl = _as_arrow_table(df_events)
+        dataset_root.mkdir(parents=True, exist_ok=True)
+        pq.write_to_dataset(
+            tbl,
+            root_path=dataset_root,
+            partition_cols=["match_id"],
+            existing_data_behavior="delete_matching",
+            **_PARQUET_WRITE_KWARGS,
+        )
+        logger.info(f"Appended {tbl.num_rows} event rows to {dataset_root}")
+        return df_events if isinstance(df_events, pd.DataFrame) else tbl.to_pandas()
 
     @staticmethod
     def load_or_append_qualifiers(
         df_qualifiers: pd.DataFrame = None, output_dir: str = "data/match-events"
     ) -> pd.DataFrame:
-        parquet_path = Path(output_dir) / "qualifiers.parquet"
+        dataset_root = Path(output_dir) / "qualifiers"
+        legacy_path = Path(output_dir) / "qualifiers.parquet"
 
         if df_qualifiers is None:
-            if parquet_path.exists():
-                logger.info(f"Loading qualifiers parquet: {parquet_path}")
-                df_result = pd.read_parquet(parquet_path)
-                logger.info(f"Loaded qualifiers with {len(df_result)} rows")
-                return df_result
-            else:
-                logger.error(f"No qualifiers parquet found at: {parquet_path}")
-                raise FileNotFoundError(f"Parquet file not found: {parquet_path}")
-        else:
-            parquet_path.parent.mkdir(parents=True, exist_ok=True)
-            if parquet_path.exists():
-                logger.info(f"Loading existing qualifiers parquet: {parquet_path}")
-                df_existing = pd.read_parquet(parquet_path)
-                df_combined = pd.concat([df_existing, df_qualifiers], ignore_index=True)
-                logger.info(f"Appended new qualifiers. Total rows: {len(df_combined)}")
-            else:
-                logger.info(f"Creating new qualifiers parquet: {parquet_path}")
-                df_combined = df_qualifiers
+            # Legacy qualifier files predate the match_id column, so the
+            # stable Opta event ids stand in for deduplication
+            return EventsDataParser._read_dataset(
+                dataset_root, legacy_path, "qualifiers", dedupe_col="event_id"
+            )
 
-            df_combined.to_parquet(parquet_path, index=False)
-            logger.info(f"Saved qualifiers parquet with {len(df_combined)} rows")
-            return df_combined
+        # Partitioned identically to events: re-ingesting a match replaces
+        # its qualifier partition in lockstep with its events partition, so
+        # the two tables cannot drift out of sync
+        tbl = _as_arrow_table(df_qualifiers)
+        dataset_root.mkdir(parents=True, exist_ok=True)
+        pq.write_to_dataset(
+            tbl,
+            root_path=dataset_root,
+            partition_cols=["match_id"],
+            existing_data_behavior="delete_matching",
+            **_PARQUET_WRITE_KWARGS,
+        )
+        logger.info(f"Appended {tbl.num_rows} qualifier rows to {dataset_root}")
+        return (
+            df_qualifiers
+            if isinstance(df_qualifiers, pd.DataFrame)
+            else tbl.to_pandas()
+        )
+
+    @staticmethod
+    def _read_dataset(
+        dataset_root: Path,
+        legacy_path: Path,
+        what: str,
+        dedupe_col: Optional[str] = None,
+    ) -> pd.DataFrame:
+        tbl = None
+        if dataset_root.exists():
+            logger.info(f"Loading {what} dataset: {dataset_root}")
+            tbl = pq.read_table(dataset_root)
+        if legacy_path.exists():
+            # History written before the partitioned layout; union it in
+            # rather than letting the dataset shadow it. Where both sides
+            # cover the same dedupe_col values (a match re-ingested after
+            # the layout switch) the dataset rows win
+            logger.info(f"Loading legacy {what} parquet: {legacy_path}")
+            legacy = pq.read_table(legacy_path)
+            if tbl is None:
+                tbl = legacy
+            else:
+                # Decode dictionary columns (the partition column in
+                # particular) on both sides first — concat_tables cannot
+                # merge dictionary<string> with plain string, and the
+                # legacy schema also carries wider integer types
+                tbl = _decode_dictionary_columns(tbl)
+                legacy = _decode_dictionary_columns(legacy)
+                if dedupe_col is not None and dedupe_col in legacy.column_names:
+                    existing = set(tbl.column(dedupe_col).to_pylist())
+                    if existing:
+                        keep = pc.invert(
+                            pc.is_in(
+                                legacy.column(dedupe_col),
+                                value_set=pa.array(list(existing)),
+                            )
+                        )
+                        legacy = legacy.filter(keep)
+                if legacy.num_rows:
+                    tbl = pa.concat_tables(
+                        [tbl, legacy], promote_options="permissive"
+                    )
+        if tbl is None:
+            logger.error(f"No {what} data found under: {dataset_root.parent}")
+            raise FileNotFoundError(f"Parquet dataset not found: {dataset_root}")
+        logger.info(f"Loaded {what} with {tbl.num_rows} rows")
+        return tbl.to_pandas(types_mapper=_ARROW_TO_PANDAS_DTYPES.get)
+
+
+def _parse_one_to_arrow(path: str) -> Tuple[pa.Table, pa.Table]:
+    # Module-level so ProcessPoolExecutor can pickle it by reference
+    parser = EventsDataParser(None, file_path=path)
+    parser.extract_match_metadata()
+    parser.parse_events_and_qualifiers()
+    return parser.tbl_events, parser.tbl_qualifiers
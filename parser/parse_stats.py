@@ -1,13 +1,66 @@
 import pandas as pd
-import json
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import orjson
 import logging
 import os
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional
 
 logging.basicConfig(level=logging.INFO, format="%(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
+def _fill_stat_columns_py(
+    lineup_array: List,
+    teams: Dict,
+    team_ids: List,
+    player_ids: List,
+    match_names: List,
+    shirt_numbers: List,
+    positions: List,
+    stat_cols: Dict[str, List],
+    stat_numeric: Dict[str, bool],
+) -> None:
+    """
+    Fill preallocated per-player columns from the lineUp array by row index.
+
+    Pure-Python fallback for the compiled version in _fast_stats.pyx. A
+    stat type repeated for the same player keeps the last value.
+    """
+    # Bind dict.get once; this loop runs millions of times across a
+    # batch and the unbound form skips the per-call method lookup
+    _get = dict.get
+
+    i = 0
+    for team_data in lineup_array:
+        team_id = _get(team_data, "contestantId")
+        teams[team_id] = team_data
+
+        for player in _get(team_data, "player", []):
+            team_ids[i] = team_id
+            player_ids[i] = _get(player, "playerId")
+            match_names[i] = _get(player, "matchName")
+            shirt_numbers[i] = _get(player, "shirtNumber")
+            positions[i] = _get(player, "position")
+
+            for stat in _get(player, "stat", []):
+                stat_type = _get(stat, "type")
+                value = _get(stat, "value")
+                if value is not None and not isinstance(value, (int, float)):
+                    stat_numeric[stat_type] = False
+                stat_cols[stat_type][i] = value
+
+            i += 1
+
+
+try:
+    from ._fast_stats import fill_stat_columns as _fill_stat_columns
+except ImportError:
+    _fill_stat_columns = _fill_stat_columns_py
+
+
 class StatsParser:
     """
     Parser for extracting player statistics from match data
@@ -20,6 +73,12 @@ class StatsParser:
     5. Returns a pandas DataFrame with all data
     """
 
+    # Stat types seen by any parser instance in this session, mapped to a
+    # stable column index. Matches share nearly identical stat sets, so
+    # ordering columns by this registry gives every parsed match the same
+    # schema and lets batch concatenation skip per-column promotion
+    _GLOBAL_STAT_TYPES: Dict[str, int] = {}
+
     def __init__(self, match_data: Dict):
         """
         Initialize the StatsParser with match data
@@ -30,7 +89,48 @@ class StatsParser:
         self.match_data = match_data
         self.match_id = None
         self.teams = {}
-        self.all_stats_columns = set()
+        # Maps stat_type -> column index in first-seen order; dict gives
+        # O(1) membership checks and avoids re-sorting on every access
+        self.all_stats_columns: Dict[str, int] = {}
+
+    @classmethod
+    def from_path(cls, path: str) -> "StatsParser":
+        """
+        Create a StatsParser from a match JSON file on disk
+
+        Uses orjson, whose C parser decodes the match file several times
+        faster than the stdlib json module.
+
+        Args:
+            path (str): Path to the match JSON file
+
+        Returns:
+            StatsParser: Parser initialized with the decoded match data
+        """
+        with open(path, "rb") as f:
+            return cls(orjson.loads(f.read()))
+
+    @classmethod
+    def parse_many(cls, paths: Iterable[str], workers: Optional[int] = None) -> pa.Table:
+        """
+        Parse a batch of match JSON files in parallel
+
+        Matches are independent, so the batch is spread over a process
+        pool (JSON decoding and the fill loops are GIL-bound). Each
+        worker returns an Arrow table; results are concatenated with
+        schema promotion since stat columns can differ between matches.
+
+        Args:
+            paths (Iterable[str]): Paths to match JSON files
+            workers (Optional[int]): Pool size. Default: os.cpu_count()
+
+        Returns:
+            pa.Table: Player stats for all matches combined
+        """
+        paths = list(paths)
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            tables = list(ex.map(parse_one, paths, chunksize=8))
+        return pa.concat_tables(tables, promote_options="default")
 
     def extract_match_id(self) -> str:
         """
@@ -46,87 +146,124 @@ class StatsParser:
             logger.error(f"Error extracting match ID: {e}")
             return None
 
-    def extract_lineup_data(self) -> pd.DataFrame:
+    def parse_to_arrow(self) -> pa.Table:
         """
-        Parse lineUp array and extract all player data with stats
+        Parse lineUp array into a pyarrow Table of players and their stats
+
+        Skips the pandas intermediate entirely: Arrow arrays are built
+        straight from the column lists, so consumers that only write
+        parquet never pay for a DataFrame round-trip.
 
         Returns:
-            pd.DataFrame: DataFrame with all players and their statistics
+            pa.Table: Table with all players and their statistics
         """
-        all_players = []
-
         # Extract match ID first
         self.extract_match_id()
 
         try:
             lineup_array = self.match_data["liveData"]["lineUp"]
 
+            # Bind dict.get once; the hot loops below call it millions of
+            # times across a batch and the unbound form skips the
+            # per-call method lookup
+            _get = dict.get
+
+            # First pass: cheap scan for the player count and the union of
+            # stat types, so every column can be preallocated at its final
+            # length and filled by index — no append resizing, no backfill
+            n_rows = 0
+            stat_types = set()
             for team_data in lineup_array:
-                # Extract team information
-                team_id = team_data.get("contestantId")
-                self.teams[team_id] = team_data
-
-                # Process each player in the team
-                players_list = team_data.get("player", [])
-
-                for player in players_list:
-                    # Extract basic player info
-                    player_info = {
-                        "matchId": self.match_id,
-                        "team_id": team_id,
-                        "playerId": player.get("playerId"),
-                        "matchName": player.get("matchName"),
-                        "shirtNumber": player.get("shirtNumber"),
-                        "position": player.get("position"),
-                    }
-
-                    # Extract all stats
-                    stats_list = player.get("stat", [])
-
-                    for stat in stats_list:
-                        stat_type = stat.get("type")
-                        stat_value = stat.get("value")
-
-                        # Track all stat types
-                        self.all_stats_columns.add(stat_type)
-
-                        # Add stat to player info
-                        player_info[stat_type] = stat_value
-
-                    all_players.append(player_info)
-
-            # Create DataFrame
-            df = pd.DataFrame(all_players)
-
-            # Reorder columns: basic info first, then stats
-            basic_columns = [
-                "matchId",
-                "team_id",
-                "playerId",
-                "matchName",
-                "shirtNumber",
-                "position",
-            ]
-            stat_columns = sorted(list(self.all_stats_columns))
-            column_order = basic_columns + stat_columns
-
-            # Ensure all columns exist in the DataFrame
-            for col in column_order:
-                if col not in df.columns:
-                    df[col] = None
-
-            df = df[column_order]
-
-            # Convert stat columns to numeric (handling None/NaN values)
-            for col in stat_columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-            logger.info(f"Extracted stats of shape {df.shape}")
-            return df
+                for player in _get(team_data, "player", []):
+                    n_rows += 1
+                    for stat in _get(player, "stat", []):
+                        stat_types.add(_get(stat, "type"))
+
+            global_types = StatsParser._GLOBAL_STAT_TYPES
+            for stat_type in stat_types:
+                if stat_type not in self.all_stats_columns:
+                    self.all_stats_columns[stat_type] = len(self.all_stats_columns)
+                if stat_type not in global_types:
+                    global_types[stat_type] = len(global_types)
+
+            match_ids = [self.match_id] * n_rows
+            team_ids = [None] * n_rows
+            player_ids = [None] * n_rows
+            match_names = [None] * n_rows
+            shirt_numbers = [None] * n_rows
+            positions = [None] * n_rows
+            stat_cols: Dict[str, List] = {t: [None] * n_rows for t in stat_types}
+            # Tracks whether a stat column only holds numbers (or None), in
+            # which case coercion via pd.to_numeric can be skipped entirely
+            stat_numeric: Dict[str, bool] = {t: True for t in stat_types}
+
+            # Second pass: fill the preallocated columns by row index
+            # (compiled when the _fast_stats extension has been built)
+            _fill_stat_columns(
+                lineup_array,
+                self.teams,
+                team_ids,
+                player_ids,
+                match_names,
+                shirt_numbers,
+                positions,
+                stat_cols,
+                stat_numeric,
+            )
+
+            # Columns in final order: basic info first, then stats ordered
+            # by the session-wide registry so every match emits the same
+            # schema. matchId/team_id/position repeat massively across
+            # rows, so dictionary-encode them: parquet stores int codes
+            # plus a tiny value dictionary, and to_pandas yields
+            # Categorical columns
+            dict_str = pa.dictionary(pa.int32(), pa.string())
+            stat_columns = [t for t in global_types if t in stat_cols]
+            cols = {
+                "matchId": pa.array(match_ids, type=dict_str),
+                "team_id": pa.array(team_ids, type=dict_str),
+                "playerId": player_ids,
+                "matchName": match_names,
+                "shirtNumber": shirt_numbers,
+                "position": pa.array(positions, type=dict_str),
+            }
+            # Numeric-only columns convert straight to float32 arrays (NaN
+            # for missing) — football counts/rates fit comfortably and the
+            # narrower dtype halves stat-table memory and parquet bytes.
+            # Only mixed/string columns need a pd.to_numeric coercion pass
+            for stat_type in stat_columns:
+                values = stat_cols[stat_type]
+                if stat_numeric[stat_type]:
+                    cols[stat_type] = np.fromiter(
+                        (np.nan if v is None else v for v in values),
+                        dtype=np.float32,
+                        count=n_rows,
+                    )
+                else:
+                    cols[stat_type] = pd.to_numeric(values, errors="coerce").astype(
+                        np.float32
+                    )
+
+            table = pa.table(cols)
+            logger.info(
+                f"Extracted stats of shape ({table.num_rows}, {table.num_columns})"
+            )
+            return table
 
         except KeyError as e:
             logger.error(f"Error extracting lineup data: {e}")
-            return pd.DataFrame()
+            return pa.table({})
+
+    def extract_lineup_data(self) -> pd.DataFrame:
+        """
+        Parse lineUp array and extract all player data with stats
+
+        Returns:
+            pd.DataFrame: DataFrame with all players and their statistics
+        """
+        return self.parse_to_arrow().to_pandas(
+            self_destruct=True, split_blocks=True
+        )
 
     def parse(self) -> pd.DataFrame:
         """
@@ -152,35 +289,47 @@ class StatsParser:
         Get all unique stat types available
 
         Returns:
-            List[str]: Sorted list of all stat types
+            List[str]: Stat types in first-seen order
         """
-        return sorted(list(self.all_stats_columns))
+        return list(self.all_stats_columns)
 
-    def filter_by_position(self, df: pd.DataFrame, position: str) -> pd.DataFrame:
+    def filter_by_position(
+        self, df: pd.DataFrame, position: str, copy: bool = False
+    ) -> pd.DataFrame:
         """
         Filter players by position
 
         Args:
             df (pd.DataFrame): The players dataframe
             position (str): Position to filter by (e.g., 'Midfielder', 'Defender')
+            copy (bool): Copy the result so it can be mutated without
+                SettingWithCopy warnings. Default False — read-only
+                consumers skip a full-table copy per call
 
         Returns:
             pd.DataFrame: Filtered dataframe
         """
-        return df[df["position"] == position].copy()
+        result = df[df["position"] == position]
+        return result.copy() if copy else result
 
-    def filter_by_team(self, df: pd.DataFrame, team_id: str) -> pd.DataFrame:
+    def filter_by_team(
+        self, df: pd.DataFrame, team_id: str, copy: bool = False
+    ) -> pd.DataFrame:
         """
         Filter players by team ID
 
         Args:
             df (pd.DataFrame): The players dataframe
             team_id (str): Team ID to filter by
+            copy (bool): Copy the result so it can be mutated without
+                SettingWithCopy warnings. Default False — read-only
+                consumers skip a full-table copy per call
 
         Returns:
             pd.DataFrame: Filtered dataframe
         """
-        return df[df["team_id"] == team_id].copy()
+        result = df[df["team_id"] == team_id]
+        return result.copy() if copy else result
 
     def get_summary_stats(
         self, df: pd.DataFrame, stat_columns: Optional[List[str]] = None
@@ -201,6 +350,106 @@ class StatsParser:
 
         return df[["matchName", "position"] + stat_columns].describe()
 
+    @classmethod
+    def load_filtered(
+        cls,
+        parquet_path: str = "data/match-stats/stats.parquet",
+        position: Optional[str] = None,
+        team_id: Optional[str] = None,
+        match_id: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Load a filtered subset of the stats dataset
+
+        Pushes the predicates down to the Parquet reader so row groups
+        (and, for matchId, whole partitions) that cannot match are never
+        read — much cheaper than loading everything and filtering the
+        DataFrame with filter_by_position/filter_by_team.
+
+        Args:
+            parquet_path (str): Path to the legacy flat parquet file; the
+                partitioned dataset lives in a sibling directory of the
+                same stem. Default: 'data/match-stats/stats.parquet'
+            position (Optional[str]): Keep only players with this position
+            team_id (Optional[str]): Keep only players of this team
+            match_id (Optional[str]): Keep only rows of this match
+            columns (Optional[List[str]]): Subset of columns to read
+
+        Returns:
+            pd.DataFrame: Filtered dataframe
+        """
+        filters = []
+        if position is not None:
+            filters.append(("position", "==", position))
+        if team_id is not None:
+            filters.append(("team_id", "==", team_id))
+        if match_id is not None:
+            filters.append(("matchId", "==", match_id))
+
+        dataset_root = os.path.splitext(parquet_path)[0]
+        source = dataset_root if os.path.isdir(dataset_root) else parquet_path
+        table = pq.read_table(
+            source, columns=columns, filters=filters or None
+        )
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+
+    @staticmethod
+    def _existing_match_ids(parquet_path: str) -> set:
+        """
+        Read the set of matchIds already stored in a parquet file or dataset
+
+        Reads only the matchId column, so duplicate detection does not
+        decompress the (much wider) stat columns. For a partitioned
+        dataset the ids come straight from the directory names.
+
+        Args:
+            parquet_path (str): Path to the parquet file or dataset root
+
+        Returns:
+            set: Unique matchId values present in the file
+        """
+        table = pq.read_table(parquet_path, columns=["matchId"])
+        return set(table.column("matchId").to_pylist())
+
+    @staticmethod
+    def _migrate_legacy_file(parquet_path: str, dataset_root: str) -> None:
+        """
+        Fold a flat pre-partitioned stats file into the dataset once
+
+        Runs before an append so history recorded in the old layout
+        stays visible and duplicate-detectable instead of being
+        shadowed by the dataset directory. Matches already present in
+        the dataset win over their legacy rows. The file is renamed to
+        '<name>.migrated' afterwards so it is neither re-ingested nor
+        read twice.
+
+        Args:
+            parquet_path (str): Path to the legacy flat parquet file
+            dataset_root (str): Root of the partitioned dataset
+        """
+        if not os.path.exists(parquet_path):
+            return
+        try:
+            filters = None
+            if os.path.isdir(dataset_root):
+                existing = StatsParser._existing_match_ids(dataset_root)
+                if existing:
+                    filters = [("matchId", "not in", list(existing))]
+            legacy = pq.read_table(parquet_path, filters=filters)
+            if legacy.num_rows:
+                pq.write_to_dataset(
+                    legacy,
+                    root_path=dataset_root,
+                    partition_cols=["matchId"],
+                    existing_data_behavior="delete_matching",
+                    compression="zstd",
+                )
+            os.replace(parquet_path, parquet_path + ".migrated")
+            logger.info(f"Migrated legacy parquet file into dataset: {parquet_path}")
+        except Exception as e:
+            logger.error(f"Error migrating legacy parquet file: {e}")
+
     @staticmethod
     def load_and_save_stats(
         new_df: pd.DataFrame,
@@ -208,81 +457,128 @@ class StatsParser:
         append: bool = False,
     ) -> pd.DataFrame:
         """
-        Load existing parquet file and optionally append new dataframe
+        Load the stats dataset and optionally append a new dataframe
+
+        Stats are stored as a parquet dataset partitioned by matchId (one
+        directory per match), so appending a match writes a single new
+        file and re-ingesting a match simply replaces its partition — no
+        read, concat or rewrite of the history. A flat file left over
+        from the pre-partitioned layout is still readable.
 
         Args:
-            new_df (pd.DataFrame): New dataframe to add (can be None to just load)
-            parquet_path (str): Path to the parquet file. Default: 'data/match-stats/stats.parquet'
+            new_df (pd.DataFrame | pa.Table): New data to add (can be None to just load)
+            parquet_path (str): Path to the legacy flat parquet file; the
+                partitioned dataset lives in a sibling directory of the
+                same stem. Default: 'data/match-stats/stats.parquet'
             append (bool): Whether to append new_df to existing data. Default: False
 
         Returns:
-            pd.DataFrame: Combined or loaded dataframe
+            pd.DataFrame: Appended rows when appending, otherwise the loaded dataframe
         """
-        # Ensure directory exists
-        directory = os.path.dirname(parquet_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory, exist_ok=True)
-            logger.info(f"Created directory: {directory}")
+        dataset_root = os.path.splitext(parquet_path)[0]
+
+        # Accept either a pandas DataFrame or a pyarrow Table; everything
+        # below operates on the Arrow form
+        new_table = None
+        if new_df is not None:
+            if isinstance(new_df, pa.Table):
+                new_table = new_df
+            else:
+                new_table = pa.Table.from_pandas(new_df, preserve_index=False)
 
-        # Load existing parquet file if it exists
-        if os.path.exists(parquet_path):
-            try:
+        if not (append and new_table is not None and new_table.num_rows > 0):
+            if append:
+                logger.warning(
+                    "Append requested but new_df is None or empty. Returning existing data."
+                )
+            else:
+                logger.info("Append not requested. Returning existing data.")
+
+            if os.path.isdir(dataset_root):
+                table = pq.read_table(dataset_root)
+                if os.path.exists(parquet_path):
+                    # Flat file not yet folded in (migration runs on
+                    # the first append): union it so pre-partitioning
+                    # history stays visible, dataset rows winning for
+                    # any match present in both
+                    existing = set(table.column("matchId").to_pylist())
+                    legacy = pq.read_table(
+                        parquet_path,
+                        filters=[("matchId", "not in", list(existing))]
+                        if existing
+                        else None,
+                    )
+                    if legacy.num_rows:
+                        # matchId (and the other dictionary-encoded
+                        # columns) read back as dictionary<string> from
+                        # the dataset but plain string from the flat
+                        # file; decode before concatenating or schema
+                        # merging fails
+                        for i, field in enumerate(table.schema):
+                            if pa.types.is_dictionary(field.type):
+                                table = table.set_column(
+                                    i,
+                                    field.name,
+                                    table.column(i).cast(field.type.value_type),
+                                )
+                        table = pa.concat_tables(
+                            [table, legacy], promote_options="permissive"
+                        )
+                existing_df = table.to_pandas()
+                logger.info(f"Loaded stats dataset: {dataset_root}")
+                logger.info(f"Existing dataframe shape: {existing_df.shape}")
+                return existing_df
+            if os.path.exists(parquet_path):
                 existing_df = pd.read_parquet(parquet_path)
-                logger.info(f"Loaded existing parquet file: {parquet_path}")
+                logger.info(f"Loaded legacy parquet file: {parquet_path}")
                 logger.info(f"Existing dataframe shape: {existing_df.shape}")
-            except Exception as e:
-                logger.error(f"Error loading parquet file: {e}")
-                existing_df = pd.DataFrame()
-        else:
-            logger.info(
-                f"Parquet file not found at {parquet_path}. Will create new file."
-            )
-            existing_df = pd.DataFrame()
+                return existing_df
+            logger.info(f"No stats dataset found at {dataset_root}.")
+            return pd.DataFrame()
 
-        # Append new data if requested
-        if append and new_df is not None and not new_df.empty:
-            logger.info(f"Appending new dataframe with shape: {new_df.shape}")
+        logger.info(
+            f"Appending new data with shape: ({new_table.num_rows}, {new_table.num_columns})"
+        )
 
-            # Combine dataframes
-            if existing_df.empty:
-                combined_df = new_df.copy()
-                logger.info("No existing data. Using new dataframe as base.")
-            else:
-                # Check for duplicate matchIds
-                existing_match_ids = set(existing_df["matchId"].unique())
-                new_match_ids = set(new_df["matchId"].unique())
-                duplicate_matches = existing_match_ids.intersection(new_match_ids)
+        # Fold any flat pre-partitioned file into the dataset before the
+        # duplicate check, so its matches stay visible and detectable.
+        # Creating the directory happens inside write_to_dataset, after
+        # the check — an empty dir here would make the check read nothing
+        # and log a spurious error on the very first append
+        StatsParser._migrate_legacy_file(parquet_path, dataset_root)
 
+        if os.path.isdir(dataset_root):
+            try:
+                duplicate_matches = StatsParser._existing_match_ids(
+                    dataset_root
+                ).intersection(set(new_table.column("matchId").to_pylist()))
                 if duplicate_matches:
                     logger.warning(
-                        f"Found {len(duplicate_matches)} duplicate match(es): {duplicate_matches}"
-                    )
-                    logger.warning(
-                        "Removing duplicate matches from existing data before appending"
+                        f"Overwriting partition(s) for duplicate match(es): {duplicate_matches}"
                     )
-                    existing_df = existing_df[
-                        ~existing_df["matchId"].isin(duplicate_matches)
-                    ]
+            except Exception as e:
+                logger.error(f"Error reading existing stats dataset: {e}")
 
-                combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-                logger.info(f"Combined dataframe shape: {combined_df.shape}")
+        try:
+            pq.write_to_dataset(
+                new_table,
+                root_path=dataset_root,
+                partition_cols=["matchId"],
+                existing_data_behavior="delete_matching",
+                compression="zstd",
+            )
+            logger.info(f"Successfully saved to dataset: {dataset_root}")
+            return new_df
+        except Exception as e:
+            logger.error(f"Error saving to dataset: {e}")
+            return new_df
 
-            # Save to parquet
-            try:
-                combined_df.to_parquet(parquet_path, index=False)
-                logger.info(f"Successfully saved to parquet: {parquet_path}")
-                logger.info(f"Total records in parquet: {len(combined_df)}")
-                return combined_df
-            except Exception as e:
-                logger.error(f"Error saving to parquet: {e}")
-                return combined_df
 
-        else:
-            if append:
-                logger.warning(
-                    "Append requested but new_df is None or empty. Returning existing data."
-                )
-            else:
-                logger.info("Append not requested. Returning existing data.")
+def parse_one(path: str) -> pa.Table:
+    """
+    Parse a single match JSON file into an Arrow table of player stats.
 
-            return existing_df
+    Module-level so it is picklable by ProcessPoolExecutor workers in
+    StatsParser.parse_many.
+    """
+    return StatsParser.from_path(path).parse_to_arrow()
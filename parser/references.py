@@ -1,8 +1,11 @@
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+from sys import intern
+from types import MappingProxyType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QualifierReference:
     qualifier_id: int
     name: str
@@ -10,8 +13,46 @@ class QualifierReference:
     description: str
 
 
-class OptaEventTypeReference:
-    EVENT_TYPES = {
+# Canonical storage for value_type literals ("Boolean", "Player ID", ...)
+# so every entry sharing a type points at one string object
+_VALUE_TYPES: Dict[str, str] = {}
+
+
+def _q(
+    qualifier_id: int, name: str, value_type: str, description: str
+) -> Tuple[int, str, str, str]:
+    """Build a raw qualifier row with interned, deduplicated strings."""
+    return (
+        qualifier_id,
+        intern(name),
+        _VALUE_TYPES.setdefault(value_type, intern(value_type)),
+        intern(description),
+    )
+
+
+class _LazyTablesMeta(type):
+    """
+    Metaclass that defers building a reference class's lookup tables.
+
+    _LAZY_ATTRS maps attribute names to the classmethod that materializes
+    them on first access, so importing this module does not pay for
+    constructing and interning hundreds of reference entries on code
+    paths (e.g. the scrapers) that never look one up — and tables that
+    are independent (event names vs descriptions) build independently.
+    """
+
+    def __getattr__(cls, name):
+        builder = type.__getattribute__(cls, "_LAZY_ATTRS").get(name)
+        if builder is not None:
+            getattr(cls, builder)()
+            return type.__getattribute__(cls, name)
+        raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")
+
+
+class OptaEventTypeReference(metaclass=_LazyTablesMeta):
+    # Read-only view: callers cannot accidentally poison the reference
+    # data, and the proxy documents that the table is a constant
+    EVENT_TYPES = MappingProxyType({
         1: {
             "name": "Pass",
             "description": "Any pass attempted from one player to another",
@@ -115,273 +156,460 @@ class OptaEventTypeReference:
         72: {"name": "Caught Offside", "description": "Player in offside position"},
         73: {"name": "Other Ball Contact", "description": "Automated DFL event"},
         74: {"name": "Blocked Pass", "description": "Defender blocks pass"},
+    })
+
+    # Built lazily on first access:
+    # TYPE_NAMES — flat id -> name dict for vectorized lookups (Series.map);
+    # _NAME_TABLE/_DESC_TABLE — id-indexed tuples (None for gaps) so the
+    # scalar lookups are a single C array access instead of nested dicts.
+    # Name and description tables build independently: the common event
+    # enrichment path only ever touches names, so the long description
+    # strings stay cold until get_type_description is first called
+    _LAZY_ATTRS = {
+        "TYPE_NAMES": "_build_name_tables",
+        "NAME_TO_ID": "_build_name_tables",
+        "_NAME_TABLE": "_build_name_tables",
+        "_DESC_TABLE": "_build_desc_tables",
     }
 
+    @classmethod
+    def _build_name_tables(cls) -> None:
+        if "_NAME_TABLE" in cls.__dict__:
+            return
+        # Intern the names so every table built from EVENT_TYPES shares
+        # the same objects
+        for entry in cls.EVENT_TYPES.values():
+            entry["name"] = intern(entry["name"])
+
+        cls.TYPE_NAMES = {
+            type_id: entry["name"] for type_id, entry in cls.EVENT_TYPES.items()
+        }
+        # Reverse index so name -> id resolution is one hash hit instead
+        # of a scan over EVENT_TYPES
+        cls.NAME_TO_ID = MappingProxyType(
+            {entry["name"]: type_id for type_id, entry in cls.EVENT_TYPES.items()}
+        )
+
+        size = max(cls.EVENT_TYPES) + 1
+        names: List[Optional[str]] = [None] * size
+        for type_id, entry in cls.EVENT_TYPES.items():
+            names[type_id] = entry["name"]
+        cls._NAME_TABLE = tuple(names)
+
+    @classmethod
+    def _build_desc_tables(cls) -> None:
+        if "_DESC_TABLE" in cls.__dict__:
+            return
+        for entry in cls.EVENT_TYPES.values():
+            entry["description"] = intern(entry["description"])
+
+        size = max(cls.EVENT_TYPES) + 1
+        descriptions: List[Optional[str]] = [None] * size
+        for type_id, entry in cls.EVENT_TYPES.items():
+            descriptions[type_id] = entry["description"]
+        cls._DESC_TABLE = tuple(descriptions)
+
+    @classmethod
+    def get_type_id(cls, name: str) -> Optional[int]:
+        return cls.NAME_TO_ID.get(name)
+
     @classmethod
     def get_type_name(cls, type_id: int) -> str:
-        return cls.EVENT_TYPES.get(type_id, {}).get("name", f"Unknown (ID: {type_id})")
+        return get_type_name(type_id)
 
     @classmethod
     def get_type_description(cls, type_id: int) -> str:
-        return cls.EVENT_TYPES.get(type_id, {}).get("description", "No description")
-
-
-class OptaQualifierReference:
-    QUALIFIERS = {
-        1: QualifierReference(1, "Long ball", "Boolean", "Pass over 35 yards"),
-        2: QualifierReference(2, "Cross", "Boolean", "Ball from wide areas into box"),
-        3: QualifierReference(3, "Head pass", "Boolean", "Pass made with head"),
-        4: QualifierReference(4, "Through ball", "Boolean", "Ball for attacking run"),
-        5: QualifierReference(5, "Free kick taken", "Boolean", "Free kick taken"),
-        6: QualifierReference(6, "Corner taken", "Boolean", "Corner kick taken"),
-        7: QualifierReference(
+        table = cls._DESC_TABLE
+        try:
+            if 0 <= type_id < len(table):
+                description = table[type_id]
+                if description is not None:
+                    return description
+        except TypeError:
+            # Non-integer id (e.g. None from an event missing typeId)
+            pass
+        return "No description"
+
+
+def _build_qualifiers() -> Dict[int, Tuple[int, str, str, str]]:
+    """Construct the raw qualifier rows (deferred until first use)."""
+    return {
+        1: _q(1, "Long ball", "Boolean", "Pass over 35 yards"),
+        2: _q(2, "Cross", "Boolean", "Ball from wide areas into box"),
+        3: _q(3, "Head pass", "Boolean", "Pass made with head"),
+        4: _q(4, "Through ball", "Boolean", "Ball for attacking run"),
+        5: _q(5, "Free kick taken", "Boolean", "Free kick taken"),
+        6: _q(6, "Corner taken", "Boolean", "Corner kick taken"),
+        7: _q(
             7, "Players caught offside", "Player ID", "Player in offside"
         ),
-        8: QualifierReference(
+        8: _q(
             8, "Goal disallowed", "Boolean", "Pass led to disallowed goal"
         ),
-        9: QualifierReference(9, "Penalty", "Boolean", "Penalty kick"),
-        15: QualifierReference(15, "Head", "Boolean", "Action with head"),
-        20: QualifierReference(20, "Right footed", "Boolean", "Shot with right foot"),
-        21: QualifierReference(
+        9: _q(9, "Penalty", "Boolean", "Penalty kick"),
+        15: _q(15, "Head", "Boolean", "Action with head"),
+        20: _q(20, "Right footed", "Boolean", "Shot with right foot"),
+        21: _q(
             21, "Other body part", "Boolean", "Shot with other body part"
         ),
-        28: QualifierReference(28, "Own goal", "Boolean", "Own goal"),
-        29: QualifierReference(29, "Assisted", "Boolean", "Shot had assist"),
-        30: QualifierReference(30, "Involved", "Player IDs", "Players in lineup"),
-        31: QualifierReference(31, "Yellow card", "Boolean", "Yellow card shown"),
-        32: QualifierReference(32, "Second yellow", "Boolean", "Second yellow card"),
-        33: QualifierReference(33, "Red card", "Boolean", "Red card shown"),
-        34: QualifierReference(34, "Referee abuse", "Boolean", "Card for abuse to ref"),
-        35: QualifierReference(35, "Argument", "Boolean", "Card for argument"),
-        36: QualifierReference(36, "Fight", "Boolean", "Card for fight"),
-        37: QualifierReference(37, "Time wasting", "Boolean", "Card for time wasting"),
-        38: QualifierReference(
+        28: _q(28, "Own goal", "Boolean", "Own goal"),
+        29: _q(29, "Assisted", "Boolean", "Shot had assist"),
+        30: _q(30, "Involved", "Player IDs", "Players in lineup"),
+        31: _q(31, "Yellow card", "Boolean", "Yellow card shown"),
+        32: _q(32, "Second yellow", "Boolean", "Second yellow card"),
+        33: _q(33, "Red card", "Boolean", "Red card shown"),
+        34: _q(34, "Referee abuse", "Boolean", "Card for abuse to ref"),
+        35: _q(35, "Argument", "Boolean", "Card for argument"),
+        36: _q(36, "Fight", "Boolean", "Card for fight"),
+        37: _q(37, "Time wasting", "Boolean", "Card for time wasting"),
+        38: _q(
             38, "Excessive celebration", "Boolean", "Card for celebration"
         ),
-        39: QualifierReference(
+        39: _q(
             39, "Crowd interaction", "Boolean", "Card for crowd contact"
         ),
-        40: QualifierReference(
+        40: _q(
             40, "Other reason", "Boolean", "Card for unknown reason"
         ),
-        41: QualifierReference(41, "Injury", "Boolean", "Substitution for injury"),
-        42: QualifierReference(42, "Tactical", "Boolean", "Substitution for tactics"),
-        44: QualifierReference(44, "Player position", "Text", "GK/DEF/MID/FWD/SUB"),
-        50: QualifierReference(
+        41: _q(41, "Injury", "Boolean", "Substitution for injury"),
+        42: _q(42, "Tactical", "Boolean", "Substitution for tactics"),
+        44: _q(44, "Player position", "Text", "GK/DEF/MID/FWD/SUB"),
+        50: _q(
             50, "Official position", "1-4", "Referee/Linesman positions"
         ),
-        51: QualifierReference(51, "Official ID", "ID", "Unique official ID"),
-        53: QualifierReference(53, "Injured player ID", "Player ID", "Injured player"),
-        54: QualifierReference(54, "End cause", "1-100", "Reason for match end"),
-        56: QualifierReference(56, "Zone", "Text", "Back/Left/Centre/Right"),
-        57: QualifierReference(57, "End type", "Type", "End of match period"),
-        59: QualifierReference(59, "Jersey number", "Integer", "Shirt number"),
-        72: QualifierReference(72, "Left footed", "Boolean", "Shot with left foot"),
-        88: QualifierReference(88, "High claim", "Boolean", "GK high claim"),
-        89: QualifierReference(89, "1 on 1", "Boolean", "Attacker 1-on-1 with GK"),
-        90: QualifierReference(90, "Deflected save", "Boolean", "GK deflected save"),
-        91: QualifierReference(
+        51: _q(51, "Official ID", "ID", "Unique official ID"),
+        53: _q(53, "Injured player ID", "Player ID", "Injured player"),
+        54: _q(54, "End cause", "1-100", "Reason for match end"),
+        56: _q(56, "Zone", "Text", "Back/Left/Centre/Right"),
+        57: _q(57, "End type", "Type", "End of match period"),
+        59: _q(59, "Jersey number", "Integer", "Shirt number"),
+        72: _q(72, "Left footed", "Boolean", "Shot with left foot"),
+        88: _q(88, "High claim", "Boolean", "GK high claim"),
+        89: _q(89, "1 on 1", "Boolean", "Attacker 1-on-1 with GK"),
+        90: _q(90, "Deflected save", "Boolean", "GK deflected save"),
+        91: _q(
             91, "Dive and deflect", "Boolean", "GK dive and deflect"
         ),
-        92: QualifierReference(92, "Catch", "Boolean", "GK catches"),
-        93: QualifierReference(93, "Dive and catch", "Boolean", "GK dive and catch"),
-        95: QualifierReference(95, "Back pass", "Boolean", "Illegal GK back pass"),
-        106: QualifierReference(
+        92: _q(92, "Catch", "Boolean", "GK catches"),
+        93: _q(93, "Dive and catch", "Boolean", "GK dive and catch"),
+        95: _q(95, "Back pass", "Boolean", "Illegal GK back pass"),
+        106: _q(
             106, "Attacking pass", "Boolean", "Pass in opposition half"
         ),
-        107: QualifierReference(107, "Throw-in", "Boolean", "Throw-in taken"),
-        108: QualifierReference(108, "Volley", "Boolean", "Shot on volley"),
-        109: QualifierReference(109, "Overhead", "Boolean", "Overhead kick"),
-        113: QualifierReference(113, "Strong", "Boolean", "Strong shot"),
-        114: QualifierReference(114, "Weak", "Boolean", "Weak shot"),
-        115: QualifierReference(115, "Rising", "Boolean", "Rising shot"),
-        116: QualifierReference(116, "Dipping", "Boolean", "Dipping shot"),
-        117: QualifierReference(117, "Lob", "Boolean", "Lob attempt"),
-        120: QualifierReference(120, "Swerve left", "Boolean", "Swerve left"),
-        121: QualifierReference(121, "Swerve right", "Boolean", "Swerve right"),
-        122: QualifierReference(122, "Swerve moving", "Boolean", "Multiple swerves"),
-        123: QualifierReference(123, "Keeper throw", "Boolean", "GK throws"),
-        124: QualifierReference(124, "Goal kick", "Boolean", "Goal kick taken"),
-        128: QualifierReference(128, "Punch", "Boolean", "GK punches"),
-        130: QualifierReference(
+        107: _q(107, "Throw-in", "Boolean", "Throw-in taken"),
+        108: _q(108, "Volley", "Boolean", "Shot on volley"),
+        109: _q(109, "Overhead", "Boolean", "Overhead kick"),
+        113: _q(113, "Strong", "Boolean", "Strong shot"),
+        114: _q(114, "Weak", "Boolean", "Weak shot"),
+        115: _q(115, "Rising", "Boolean", "Rising shot"),
+        116: _q(116, "Dipping", "Boolean", "Dipping shot"),
+        117: _q(117, "Lob", "Boolean", "Lob attempt"),
+        120: _q(120, "Swerve left", "Boolean", "Swerve left"),
+        121: _q(121, "Swerve right", "Boolean", "Swerve right"),
+        122: _q(122, "Swerve moving", "Boolean", "Multiple swerves"),
+        123: _q(123, "Keeper throw", "Boolean", "GK throws"),
+        124: _q(124, "Goal kick", "Boolean", "Goal kick taken"),
+        128: _q(128, "Punch", "Boolean", "GK punches"),
+        130: _q(
             130, "Team formation", "Formation ID", "Team formation"
         ),
-        131: QualifierReference(
+        131: _q(
             131, "Team player formation", "1-11", "Player formation slot"
         ),
-        132: QualifierReference(132, "Dive", "Boolean", "Simulation/dive"),
-        133: QualifierReference(133, "Deflection", "Boolean", "Shot deflection"),
-        136: QualifierReference(136, "Keeper touched", "Boolean", "GK touched goal"),
-        137: QualifierReference(137, "Keeper saved", "Boolean", "GK saved wide shot"),
-        138: QualifierReference(138, "Hit woodwork", "Boolean", "Hit post/bar"),
-        139: QualifierReference(139, "Own player", "Boolean", "Shot saved by defender"),
-        140: QualifierReference(140, "Pass End X", "0-100", "X coordinate of pass end"),
-        141: QualifierReference(141, "Pass End Y", "0-100", "Y coordinate of pass end"),
-        144: QualifierReference(
+        132: _q(132, "Dive", "Boolean", "Simulation/dive"),
+        133: _q(133, "Deflection", "Boolean", "Shot deflection"),
+        136: _q(136, "Keeper touched", "Boolean", "GK touched goal"),
+        137: _q(137, "Keeper saved", "Boolean", "GK saved wide shot"),
+        138: _q(138, "Hit woodwork", "Boolean", "Hit post/bar"),
+        139: _q(139, "Own player", "Boolean", "Shot saved by defender"),
+        140: _q(140, "Pass End X", "0-100", "X coordinate of pass end"),
+        141: _q(141, "Pass End Y", "0-100", "Y coordinate of pass end"),
+        144: _q(
             144, "Deleted event type", "Event ID", "Event to remove"
         ),
-        152: QualifierReference(152, "Direct", "Boolean", "Direct free kick"),
-        153: QualifierReference(153, "Not past goal line", "Boolean", "Shot missed"),
-        154: QualifierReference(
+        152: _q(152, "Direct", "Boolean", "Direct free kick"),
+        153: _q(153, "Not past goal line", "Boolean", "Shot missed"),
+        154: _q(
             154, "Intentional assist", "Boolean", "Intentional assist"
         ),
-        155: QualifierReference(155, "Chipped", "Boolean", "Chipped pass"),
-        156: QualifierReference(156, "Lay-off", "Boolean", "Lay-off pass"),
-        157: QualifierReference(157, "Launch", "Boolean", "Launch pass"),
-        158: QualifierReference(
+        155: _q(155, "Chipped", "Boolean", "Chipped pass"),
+        156: _q(156, "Lay-off", "Boolean", "Lay-off pass"),
+        157: _q(157, "Launch", "Boolean", "Launch pass"),
+        158: _q(
             158, "Persistent infringement", "Boolean", "Persistent foul"
         ),
-        159: QualifierReference(159, "Foul language", "Boolean", "Foul language"),
-        160: QualifierReference(
+        159: _q(159, "Foul language", "Boolean", "Foul language"),
+        160: _q(
             160, "Throw-in set piece", "Boolean", "Throw-in set piece"
         ),
-        161: QualifierReference(161, "Encroachment", "Boolean", "Encroachment"),
-        162: QualifierReference(162, "Leaving field", "Boolean", "Leaving field"),
-        163: QualifierReference(163, "Entering field", "Boolean", "Entering field"),
-        164: QualifierReference(164, "Spitting", "Boolean", "Spitting"),
-        165: QualifierReference(
+        161: _q(161, "Encroachment", "Boolean", "Encroachment"),
+        162: _q(162, "Leaving field", "Boolean", "Leaving field"),
+        163: _q(163, "Entering field", "Boolean", "Entering field"),
+        164: _q(164, "Spitting", "Boolean", "Spitting"),
+        165: _q(
             165, "Professional foul", "Boolean", "Professional foul"
         ),
-        166: QualifierReference(166, "Handling on line", "Boolean", "Handball block"),
-        168: QualifierReference(168, "Flick-on", "Boolean", "Flick-on pass"),
-        171: QualifierReference(171, "Rescinded card", "Boolean", "Card rescinded"),
-        172: QualifierReference(
+        166: _q(166, "Handling on line", "Boolean", "Handball block"),
+        168: _q(168, "Flick-on", "Boolean", "Flick-on pass"),
+        171: _q(171, "Rescinded card", "Boolean", "Card rescinded"),
+        172: _q(
             172, "No impact on timing", "Boolean", "Booked off bench"
         ),
-        173: QualifierReference(173, "Parried safe", "Boolean", "GK parries safe"),
-        174: QualifierReference(
+        173: _q(173, "Parried safe", "Boolean", "GK parries safe"),
+        174: _q(
             174, "Parried danger", "Boolean", "GK parries to danger"
         ),
-        175: QualifierReference(175, "Fingertip", "Boolean", "GK fingertip save"),
-        176: QualifierReference(176, "Caught", "Boolean", "GK catches"),
-        177: QualifierReference(177, "Collected", "Boolean", "GK collects"),
-        178: QualifierReference(178, "Standing", "Boolean", "GK standing save"),
-        179: QualifierReference(179, "Diving", "Boolean", "GK diving save"),
-        180: QualifierReference(180, "Stooping", "Boolean", "GK stooping save"),
-        181: QualifierReference(181, "Reaching", "Boolean", "GK reaching save"),
-        182: QualifierReference(182, "Hands", "Boolean", "GK saves with hands"),
-        183: QualifierReference(183, "Feet", "Boolean", "GK saves with feet"),
-        184: QualifierReference(184, "Dissent", "Boolean", "Card for dissent"),
-        186: QualifierReference(186, "Scored", "Stat", "Shot not saved = goal"),
-        187: QualifierReference(187, "Saved", "Stat", "Shot saved"),
-        188: QualifierReference(188, "Missed", "Stat", "Shot missed"),
-        189: QualifierReference(189, "Player not visible", "Boolean", "Replay shown"),
-        191: QualifierReference(191, "Off ball foul", "Boolean", "Off-ball foul"),
-        192: QualifierReference(192, "Block by hand", "Boolean", "Block by hand"),
-        194: QualifierReference(194, "Captain", "Player ID", "Team captain ID"),
-        195: QualifierReference(195, "Pull back", "Boolean", "Pull back pass"),
-        196: QualifierReference(196, "Switch of play", "Boolean", "Switch of play"),
-        197: QualifierReference(197, "Team kit", "Kit ID", "Team kit ID"),
-        198: QualifierReference(198, "GK hoof", "Boolean", "GK kicks long"),
-        199: QualifierReference(
+        175: _q(175, "Fingertip", "Boolean", "GK fingertip save"),
+        176: _q(176, "Caught", "Boolean", "GK catches"),
+        177: _q(177, "Collected", "Boolean", "GK collects"),
+        178: _q(178, "Standing", "Boolean", "GK standing save"),
+        179: _q(179, "Diving", "Boolean", "GK diving save"),
+        180: _q(180, "Stooping", "Boolean", "GK stooping save"),
+        181: _q(181, "Reaching", "Boolean", "GK reaching save"),
+        182: _q(182, "Hands", "Boolean", "GK saves with hands"),
+        183: _q(183, "Feet", "Boolean", "GK saves with feet"),
+        184: _q(184, "Dissent", "Boolean", "Card for dissent"),
+        186: _q(186, "Scored", "Stat", "Shot not saved = goal"),
+        187: _q(187, "Saved", "Stat", "Shot saved"),
+        188: _q(188, "Missed", "Stat", "Shot missed"),
+        189: _q(189, "Player not visible", "Boolean", "Replay shown"),
+        191: _q(191, "Off ball foul", "Boolean", "Off-ball foul"),
+        192: _q(192, "Block by hand", "Boolean", "Block by hand"),
+        194: _q(194, "Captain", "Player ID", "Team captain ID"),
+        195: _q(195, "Pull back", "Boolean", "Pull back pass"),
+        196: _q(196, "Switch of play", "Boolean", "Switch of play"),
+        197: _q(197, "Team kit", "Kit ID", "Team kit ID"),
+        198: _q(198, "GK hoof", "Boolean", "GK kicks long"),
+        199: _q(
             199, "GK kick from hands", "Boolean", "GK kicks from hands"
         ),
-        200: QualifierReference(200, "Referee stop", "Boolean", "Referee stops"),
-        201: QualifierReference(201, "Referee delay", "Boolean", "Referee delay"),
-        202: QualifierReference(202, "Weather problem", "Boolean", "Weather stoppage"),
-        203: QualifierReference(203, "Crowd trouble", "Boolean", "Crowd trouble"),
-        204: QualifierReference(204, "Fire", "Boolean", "Fire in stadium"),
-        205: QualifierReference(205, "Object thrown", "Boolean", "Object from crowd"),
-        206: QualifierReference(
+        200: _q(200, "Referee stop", "Boolean", "Referee stops"),
+        201: _q(201, "Referee delay", "Boolean", "Referee delay"),
+        202: _q(202, "Weather problem", "Boolean", "Weather stoppage"),
+        203: _q(203, "Crowd trouble", "Boolean", "Crowd trouble"),
+        204: _q(204, "Fire", "Boolean", "Fire in stadium"),
+        205: _q(205, "Object thrown", "Boolean", "Object from crowd"),
+        206: _q(
             206, "Spectator on pitch", "Boolean", "Spectator on pitch"
         ),
-        207: QualifierReference(
+        207: _q(
             207, "Awaiting decision", "Boolean", "Awaiting decision"
         ),
-        208: QualifierReference(208, "Referee injury", "Boolean", "Referee injury"),
-        209: QualifierReference(209, "Game end", "Boolean", "Game finished"),
-        210: QualifierReference(210, "Assist", "Boolean", "Pass is assist"),
-        212: QualifierReference(212, "Length", "Yards", "Pass distance in yards"),
-        213: QualifierReference(213, "Angle", "Radians", "Ball angle (0-6.28)"),
-        214: QualifierReference(214, "Big chance", "Boolean", "Big chance"),
-        215: QualifierReference(215, "Individual play", "Boolean", "Individual play"),
-        217: QualifierReference(217, "2nd assisted", "Boolean", "2nd assist"),
-        218: QualifierReference(218, "2nd assist", "Boolean", "Pass created assist"),
-        219: QualifierReference(
+        208: _q(208, "Referee injury", "Boolean", "Referee injury"),
+        209: _q(209, "Game end", "Boolean", "Game finished"),
+        210: _q(210, "Assist", "Boolean", "Pass is assist"),
+        212: _q(212, "Length", "Yards", "Pass distance in yards"),
+        213: _q(213, "Angle", "Radians", "Ball angle (0-6.28)"),
+        214: _q(214, "Big chance", "Boolean", "Big chance"),
+        215: _q(215, "Individual play", "Boolean", "Individual play"),
+        217: _q(217, "2nd assisted", "Boolean", "2nd assist"),
+        218: _q(218, "2nd assist", "Boolean", "Pass created assist"),
+        219: _q(
             219, "Players on both posts", "Boolean", "Both posts covered"
         ),
-        220: QualifierReference(
+        220: _q(
             220, "Player on near post", "Boolean", "Near post covered"
         ),
-        221: QualifierReference(
+        221: _q(
             221, "Player on far post", "Boolean", "Far post covered"
         ),
-        222: QualifierReference(
+        222: _q(
             222, "No players on posts", "Boolean", "Posts uncovered"
         ),
-        223: QualifierReference(223, "In-swinger", "Boolean", "Corner in-swinger"),
-        224: QualifierReference(224, "Out-swinger", "Boolean", "Corner out-swinger"),
-        225: QualifierReference(225, "Straight", "Boolean", "Corner straight"),
-        226: QualifierReference(226, "Suspended", "Boolean", "Game suspended"),
-        227: QualifierReference(227, "Resume", "Boolean", "Game resumed"),
-        228: QualifierReference(228, "Own shot blocked", "Boolean", "Own shot blocked"),
-        230: QualifierReference(230, "GK X coordinate", "Coordinate", "GK position X"),
-        231: QualifierReference(231, "GK Y coordinate", "Coordinate", "GK position Y"),
-        236: QualifierReference(236, "Blocked pass", "Boolean", "Blocked pass"),
-        237: QualifierReference(237, "Low", "Boolean", "Low goal kick"),
-        238: QualifierReference(238, "Fair play", "Boolean", "Fair play kick"),
-        240: QualifierReference(240, "GK start", "Boolean", "GK passes from hands"),
-        241: QualifierReference(241, "Indirect", "Boolean", "Indirect free kick"),
-        242: QualifierReference(242, "Obstruction", "Boolean", "Obstruction foul"),
-        243: QualifierReference(243, "Unsporting behavior", "Boolean", "Unsporting"),
-        244: QualifierReference(244, "Not retreating", "Boolean", "Not retreating"),
-        245: QualifierReference(245, "Serious foul", "Boolean", "Serious foul"),
-        246: QualifierReference(246, "Drinks break", "Boolean", "Drinks break"),
-        254: QualifierReference(254, "Follows dribble", "Boolean", "Follows dribble"),
-        255: QualifierReference(255, "Open roof", "Boolean", "Roof open"),
-        256: QualifierReference(256, "Air humidity", "Percent", "Humidity %"),
-        257: QualifierReference(257, "Air pressure", "Value", "Air pressure"),
-        258: QualifierReference(258, "Sold out", "Boolean", "Stadium sold out"),
-        259: QualifierReference(259, "Celsius degrees", "Temperature", "Temperature C"),
-        260: QualifierReference(260, "Floodlight", "Boolean", "Floodlit"),
-        261: QualifierReference(261, "1 on 1 chip", "Boolean", "1v1 chip goal"),
-        262: QualifierReference(262, "Back heel", "Boolean", "Back heel goal"),
-        263: QualifierReference(263, "Direct corner", "Boolean", "Direct corner goal"),
-        264: QualifierReference(264, "Aerial foul", "Boolean", "Aerial foul"),
-        265: QualifierReference(265, "Attempted tackle", "Boolean", "Tackle attempt"),
-        266: QualifierReference(266, "Put through", "Boolean", "Put through"),
-        267: QualifierReference(
+        223: _q(223, "In-swinger", "Boolean", "Corner in-swinger"),
+        224: _q(224, "Out-swinger", "Boolean", "Corner out-swinger"),
+        225: _q(225, "Straight", "Boolean", "Corner straight"),
+        226: _q(226, "Suspended", "Boolean", "Game suspended"),
+        227: _q(227, "Resume", "Boolean", "Game resumed"),
+        228: _q(228, "Own shot blocked", "Boolean", "Own shot blocked"),
+        230: _q(230, "GK X coordinate", "Coordinate", "GK position X"),
+        231: _q(231, "GK Y coordinate", "Coordinate", "GK position Y"),
+        236: _q(236, "Blocked pass", "Boolean", "Blocked pass"),
+        237: _q(237, "Low", "Boolean", "Low goal kick"),
+        238: _q(238, "Fair play", "Boolean", "Fair play kick"),
+        240: _q(240, "GK start", "Boolean", "GK passes from hands"),
+        241: _q(241, "Indirect", "Boolean", "Indirect free kick"),
+        242: _q(242, "Obstruction", "Boolean", "Obstruction foul"),
+        243: _q(243, "Unsporting behavior", "Boolean", "Unsporting"),
+        244: _q(244, "Not retreating", "Boolean", "Not retreating"),
+        245: _q(245, "Serious foul", "Boolean", "Serious foul"),
+        246: _q(246, "Drinks break", "Boolean", "Drinks break"),
+        254: _q(254, "Follows dribble", "Boolean", "Follows dribble"),
+        255: _q(255, "Open roof", "Boolean", "Roof open"),
+        256: _q(256, "Air humidity", "Percent", "Humidity %"),
+        257: _q(257, "Air pressure", "Value", "Air pressure"),
+        258: _q(258, "Sold out", "Boolean", "Stadium sold out"),
+        259: _q(259, "Celsius degrees", "Temperature", "Temperature C"),
+        260: _q(260, "Floodlight", "Boolean", "Floodlit"),
+        261: _q(261, "1 on 1 chip", "Boolean", "1v1 chip goal"),
+        262: _q(262, "Back heel", "Boolean", "Back heel goal"),
+        263: _q(263, "Direct corner", "Boolean", "Direct corner goal"),
+        264: _q(264, "Aerial foul", "Boolean", "Aerial foul"),
+        265: _q(265, "Attempted tackle", "Boolean", "Tackle attempt"),
+        266: _q(266, "Put through", "Boolean", "Put through"),
+        267: _q(
             267, "Right arm save", "Boolean", "Saved with right arm"
         ),
-        268: QualifierReference(268, "Left arm save", "Boolean", "Saved with left arm"),
-        269: QualifierReference(
+        268: _q(268, "Left arm save", "Boolean", "Saved with left arm"),
+        269: _q(
             269, "Both arms save", "Boolean", "Saved with both arms"
         ),
-        270: QualifierReference(
+        270: _q(
             270, "Right leg save", "Boolean", "Saved with right leg"
         ),
-        271: QualifierReference(271, "Left leg save", "Boolean", "Saved with left leg"),
-        272: QualifierReference(
+        271: _q(271, "Left leg save", "Boolean", "Saved with left leg"),
+        272: _q(
             272, "Both legs save", "Boolean", "Saved with both legs"
         ),
-        273: QualifierReference(273, "Hit right post", "Boolean", "Hit right post"),
-        274: QualifierReference(274, "Hit left post", "Boolean", "Hit left post"),
-        275: QualifierReference(275, "Hit bar", "Boolean", "Hit crossbar"),
-        278: QualifierReference(278, "Tap", "Boolean", "Free kick rolled"),
-        279: QualifierReference(279, "Kick off", "Boolean", "Starting pass"),
-        280: QualifierReference(280, "Fantasy assist type", "Event ID", "Assist event"),
-        281: QualifierReference(281, "Fantasy assisted by", "Text", "Player assist"),
-        282: QualifierReference(282, "Fantasy assist team", "Text", "Team assist"),
-        283: QualifierReference(283, "Coach ID", "Coach ID", "Team coach ID"),
-        284: QualifierReference(284, "Duel", "Boolean", "Blocked shot duel"),
-        287: QualifierReference(287, "Over-arm", "Boolean", "Over-arm throw"),
-        289: QualifierReference(
+        273: _q(273, "Hit right post", "Boolean", "Hit right post"),
+        274: _q(274, "Hit left post", "Boolean", "Hit left post"),
+        275: _q(275, "Hit bar", "Boolean", "Hit crossbar"),
+        278: _q(278, "Tap", "Boolean", "Free kick rolled"),
+        279: _q(279, "Kick off", "Boolean", "Starting pass"),
+        280: _q(280, "Fantasy assist type", "Event ID", "Assist event"),
+        281: _q(281, "Fantasy assisted by", "Text", "Player assist"),
+        282: _q(282, "Fantasy assist team", "Text", "Team assist"),
+        283: _q(283, "Coach ID", "Coach ID", "Team coach ID"),
+        284: _q(284, "Duel", "Boolean", "Blocked shot duel"),
+        287: _q(287, "Over-arm", "Boolean", "Over-arm throw"),
+        289: _q(
             289, "Denied goal-scoring opp", "Boolean", "Denied scoring"
         ),
-        290: QualifierReference(290, "Coach types", "Types", "Coach roles"),
+        290: _q(290, "Coach types", "Types", "Coach roles"),
     }
 
+
+class OptaQualifierReference(metaclass=_LazyTablesMeta):
+    # Built lazily on first access:
+    # QUALIFIERS — id -> QualifierReference dict (back-compat view);
+    # QUALIFIER_NAMES/QUALIFIER_DESCRIPTIONS — flat dicts for vectorized
+    # lookups (Series.map);
+    # _NAME_TABLE/_VTYPE_TABLE/_DESC_TABLE — parallel id-indexed tuples
+    # (None for gaps): a name lookup touches one flat array slot instead
+    # of chasing a pointer into a dataclass
+    _LAZY_ATTRS = {
+        "QUALIFIERS": "_build_tables",
+        "QUALIFIER_NAMES": "_build_tables",
+        "QUALIFIER_DESCRIPTIONS": "_build_tables",
+        "NAME_TO_ID": "_build_tables",
+        "_NAME_TABLE": "_build_tables",
+        "_VTYPE_TABLE": "_build_tables",
+        "_DESC_TABLE": "_build_tables",
+    }
+
+    @classmethod
+    def _build_tables(cls) -> None:
+        if "QUALIFIERS" in cls.__dict__:
+            return
+        rows = _build_qualifiers()
+        cls.QUALIFIERS = MappingProxyType(
+            {
+                qualifier_id: QualifierReference(*row)
+                for qualifier_id, row in rows.items()
+            }
+        )
+        cls.QUALIFIER_NAMES = {
+            qualifier_id: row[1] for qualifier_id, row in rows.items()
+        }
+        cls.QUALIFIER_DESCRIPTIONS = {
+            qualifier_id: row[3] for qualifier_id, row in rows.items()
+        }
+        cls.NAME_TO_ID = MappingProxyType(
+            {row[1]: qualifier_id for qualifier_id, row in rows.items()}
+        )
+
+        size = max(rows) + 1
+        names: List[Optional[str]] = [None] * size
+        value_types: List[Optional[str]] = [None] * size
+        descriptions: List[Optional[str]] = [None] * size
+        for qualifier_id, (_, name, value_type, description) in rows.items():
+            names[qualifier_id] = name
+            value_types[qualifier_id] = value_type
+            descriptions[qualifier_id] = description
+        cls._NAME_TABLE = tuple(names)
+        cls._VTYPE_TABLE = tuple(value_types)
+        cls._DESC_TABLE = tuple(descriptions)
+
+    @classmethod
+    def get_qualifier_id(cls, name: str) -> Optional[int]:
+        return cls.NAME_TO_ID.get(name)
+
     @classmethod
     def get_qualifier_info(cls, qualifier_id: int) -> Optional[QualifierReference]:
         return cls.QUALIFIERS.get(qualifier_id)
 
     @classmethod
     def get_qualifier_name(cls, qualifier_id: int) -> str:
-        qualifier = cls.QUALIFIERS.get(qualifier_id)
-        return qualifier.name if qualifier else f"Unknown (ID: {qualifier_id})"
+        return get_qualifier_name(qualifier_id)
 
     @classmethod
     def get_qualifier_description(cls, qualifier_id: int) -> str:
-        qualifier = cls.QUALIFIERS.get(qualifier_id)
-        return qualifier.description if qualifier else "No description"
+        table = cls._DESC_TABLE
+        try:
+            if 0 <= qualifier_id < len(table):
+                description = table[qualifier_id]
+                if description is not None:
+                    return description
+        except TypeError:
+            # Non-integer id (e.g. None from a qualifier missing its id)
+            pass
+        return "No description"
+
+
+# Module-level memoized scalar lookups: event feeds repeat the same hot
+# ids (Pass, Ball recovery, ...) hundreds of thousands of times, and the
+# caches saturate after one pass over the id space. The classmethods
+# above are thin wrappers kept for API compatibility.
+@lru_cache(maxsize=512)
+def get_type_name(type_id: int) -> str:
+    table = OptaEventTypeReference._NAME_TABLE
+    try:
+        if 0 <= type_id < len(table):
+            name = table[type_id]
+            if name is not None:
+                return name
+    except TypeError:
+        # Non-integer id (e.g. None from an event missing typeId)
+        pass
+    return f"Unknown (ID: {type_id})"
+
+
+@lru_cache(maxsize=512)
+def get_qualifier_name(qualifier_id: int) -> str:
+    table = OptaQualifierReference._NAME_TABLE
+    try:
+        if 0 <= qualifier_id < len(table):
+            name = table[qualifier_id]
+            if name is not None:
+                return name
+    except TypeError:
+        # Non-integer id (e.g. None from a qualifier missing its id)
+        pass
+    return f"Unknown (ID: {qualifier_id})"
+
+
+def __getattr__(name):
+    """
+    Lazily build the vectorized name Series on first access (PEP 562).
+
+    TYPE_NAME_SERIES / QUAL_NAME_SERIES map ids to names as a pandas
+    Series, for single C-level lookups over whole columns, e.g.
+
+        df["type_name"] = TYPE_NAME_SERIES.reindex(df["type_id"]).values
+
+    Built on demand so the module imports without pandas and without
+    forcing the reference tables.
+    """
+    if name == "TYPE_NAME_SERIES":
+        import pandas as pd
+
+        series = pd.Series(OptaEventTypeReference.TYPE_NAMES)
+        globals()[name] = series
+        return series
+    if name == "QUAL_NAME_SERIES":
+        import pandas as pd
+
+        series = pd.Series(OptaQualifierReference.QUALIFIER_NAMES)
+        globals()[name] = series
+        return series
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
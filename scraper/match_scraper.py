@@ -5,7 +5,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from typing import Literal
-import json
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import time
 import base64
 import re
@@ -32,6 +33,18 @@ class ScrapeMatchData:
         ```
     """
 
+    # Data types this scraper captures from the feed
+    _DATA_TYPES = frozenset({"matchevent", "matchstats"})
+
+    # Matches the feed host and captures which data type the URL carries
+    # in one C-level scan, replacing three substring checks per log entry
+    _URL_RE = re.compile(r"api\.performfeeds\.com/.*?(matchevent|matchstats)")
+
+    # Fallback JSONP unwrapper, compiled once; the fast path slices
+    # between the first '(' and last ')' without any regex. Operates on
+    # bytes — bodies are never decoded to str
+    _JSONP_RE = re.compile(rb"\((.*)\);?\s*$", re.S)
+
     def __init__(
         self, headless: bool = True, chrome_exe: str = "/opt/homebrew/bin/chromedriver"
     ):
@@ -48,9 +61,17 @@ class ScrapeMatchData:
 
         opts = Options()
         opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        # Only Network.* frames are consumed; leaving traceCategories
+        # empty keeps Chrome from dumping tracing events into the log
+        # that the Python scan would then have to wade through
         opts.add_experimental_option(
             "perfLoggingPrefs",
-            {"enableNetwork": True, "enablePage": False, "traceCategories": "network"},
+            {
+                "enableNetwork": True,
+                "enablePage": False,
+                "enableTimeline": False,
+                "traceCategories": "",
+            },
         )
         opts.add_argument("--start-maximized")
         if headless is True:
@@ -64,82 +85,172 @@ class ScrapeMatchData:
         atexit.register(self.close_webdriver)
         self.driver = webdriver.Chrome(service=service, options=opts)
 
+        # The scrape only needs the page's JS and the feed JSONP; block
+        # heavy static assets so page loads move far fewer bytes
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd(
+            "Network.setBlockedURLs",
+            {
+                "urls": [
+                    "*.png",
+                    "*.jpg",
+                    "*.jpeg",
+                    "*.gif",
+                    "*.woff",
+                    "*.woff2",
+                    "*.ttf",
+                    "*.svg",
+                    "*.mp4",
+                ]
+            },
+        )
+
     def close_webdriver(self):
+        # Drop the shutdown hook so an explicit close (e.g. scrape_many's
+        # finally) isn't replayed against the dead service at interpreter
+        # exit, which printed a connection-error traceback per batch
+        atexit.unregister(self.close_webdriver)
         self.driver.quit()
 
+    def _parse_jsonp_body(self, body_info: dict):
+        """Decode a CDP response body and unwrap its JSONP payload"""
+        body = body_info.get("body", "")
+
+        # Work on bytes throughout: orjson accepts them directly, so
+        # base64 bodies skip the utf-8 validation/copy entirely
+        if body_info.get("base64Encoded", False):
+            raw = base64.b64decode(body)
+        else:
+            raw = body.encode() if isinstance(body, str) else body
+
+        # Parse JSONP response
+        # Format: TM3_..._callback({ ... })
+        # Slicing between the first '(' and last ')' avoids an O(N)
+        # strip copy and a regex pass over the full body
+        lp = raw.find(b"(")
+        rp = raw.rfind(b")")
+        if lp != -1 and rp > lp:
+            payload = raw[lp + 1 : rp]
+        else:
+            match = self._JSONP_RE.search(raw)
+            payload = match.group(1) if match else None
+
+        if payload:
+            return orjson.loads(payload)
+        return None
+
+    def _scan_log_entries(self, logs, pending: dict) -> None:
+        """Record requestIds of matching 200 responses into pending"""
+        for entry in logs:
+            try:
+                raw = entry["message"]
+                # Most log records are requestWillBeSent/dataReceived
+                # chatter for unrelated hosts; two C-level substring
+                # checks reject them before any JSON decoding
+                if (
+                    "performfeeds" not in raw
+                    or '"Network.responseReceived"' not in raw
+                ):
+                    continue
+                msg = orjson.loads(raw)
+                message = msg.get("message", {})
+                params = message.get("params", {})
+
+                if message.get("method") == "Network.responseReceived":
+                    response = params.get("response", {})
+                    url = response.get("url", "")
+
+                    # Filter for PerformFeeds squad API
+                    url_match = self._URL_RE.search(url)
+                    if url_match and response.get("status") == 200:
+                        pending[url_match.group(1)] = params.get("requestId")
+                        # Stop scanning once every data type has a
+                        # requestId; the rest of the log is noise
+                        if pending.keys() >= self._DATA_TYPES:
+                            return
+
+            except Exception as e:
+                logger.error(f"Error while filtering network logs: {e}")
+                continue
+
+    def _wait_for_responses(self, timeout: float = 10.0) -> dict:
+        """
+        Poll the performance log until every data type has a requestId
+
+        get_log drains Chrome's buffer, so each iteration only scans
+        entries that arrived since the previous one — no fixed sleep and
+        no re-scanning. Returns whatever was found before the deadline.
+        """
+        deadline = time.monotonic() + timeout
+        pending = {}
+        while True:
+            self._scan_log_entries(self.driver.get_log("performance"), pending)
+            if pending.keys() >= self._DATA_TYPES or time.monotonic() >= deadline:
+                return pending
+            time.sleep(0.1)
+
     def capture_data(
         self,
     ):
         """Capture and parse the PerformFeeds squad API response"""
         result = {}
-        data_type = ["matchevent", "matchstats"]
         try:
-            # Wait for performance logs to be populated
-            time.sleep(3)
-
-            logs = self.driver.get_log("performance")
-            for entry in logs:
-                try:
-                    msg = json.loads(entry["message"])
-                    message = msg.get("message", {})
-                    params = message.get("params", {})
-
-                    if message.get("method") == "Network.responseReceived":
-                        response = params.get("response", {})
-                        request_id = params.get("requestId")
-                        url = response.get("url", "")
-
-                        # Filter for PerformFeeds squad API
-                        if "api.performfeeds.com" in url and any(
-                            e in url for e in data_type
-                        ):
-                            status = response.get("status")
-
-                            if status == 200:
-                                # Get response body
-                                try:
-                                    body_info = self.driver.execute_cdp_cmd(
-                                        "Network.getResponseBody",
-                                        {"requestId": request_id},
-                                    )
-
-                                    body = body_info.get("body", "")
-                                    is_base64 = body_info.get("base64Encoded", False)
-
-                                    # Decode if base64
-                                    if is_base64:
-                                        body = base64.b64decode(body).decode(
-                                            "utf-8", errors="ignore"
-                                        )
-
-                                    # Parse JSONP response
-                                    # Format: TM3_..._callback({ ... })
-                                    match = re.search(r"\((.*)\);?$", body.strip())
-
-                                    if match:
-                                        json_str = match.group(1)
-                                        data = json.loads(json_str)
-
-                                        for el in data_type:
-                                            if el in url:
-                                                logger.info(
-                                                    f"Response for {el} found..."
-                                                )
-                                                result[el] = data
-
-                                except Exception as e:
-                                    logger.error(f"Error processing response: {e}")
-                                    continue
-
-                except Exception:
-                    logger.error(f"Error while filtering network logs: {e}")
-                    continue
+            # Pass 1: poll for the matching responses instead of sleeping
+            # a fixed interval and hoping the log is populated
+            pending = self._wait_for_responses()
+
+            # Pass 2: fetch the matched bodies concurrently — each
+            # Network.getResponseBody is a full DevTools RPC round-trip,
+            # so overlapping them hides the per-call latency
+            if pending:
+                with ThreadPoolExecutor(max_workers=len(pending)) as ex:
+                    futures = {
+                        el: ex.submit(
+                            self.driver.execute_cdp_cmd,
+                            "Network.getResponseBody",
+                            {"requestId": request_id},
+                        )
+                        for el, request_id in pending.items()
+                    }
+                    for el, future in futures.items():
+                        try:
+                            data = self._parse_jsonp_body(future.result())
+                            if data is not None:
+                                logger.info(f"Response for {el} found...")
+                                result[el] = data
+                        except Exception as e:
+                            logger.error(f"Error processing response: {e}")
 
         except Exception as e:
             logger.error(f"Error capturing squads API: {e}")
         finally:
             return result
 
+    @classmethod
+    def scrape_many(cls, match_urls, **kwargs):
+        """
+        Scrape several matches with one Chrome session
+
+        Chrome startup costs seconds per instance and dwarfs a single
+        scrape, so the driver is created once and reused for the whole
+        batch. Between matches the performance log is drained (get_log
+        empties the buffer) so the next scrape never rescans old entries.
+
+        :param match_urls: Iterable of match-centre URLs
+        :param kwargs: Forwarded to the constructor (headless, chrome_exe)
+        :return: List of (matchevent, matchstats) tuples, in input order
+        """
+        scraper = cls(**kwargs)
+        results = []
+        try:
+            for match_url in match_urls:
+                results.append(scraper.scrape(match_url))
+                # Drop any leftover log entries from this match
+                scraper.driver.get_log("performance")
+        finally:
+            scraper.close_webdriver()
+        return results
+
     def scrape(
         self,
         match_url: str,
@@ -162,7 +273,6 @@ class ScrapeMatchData:
                 EC.presence_of_element_located((By.ID, "ui-id-2"))
             )
             a_elem.click()
-            time.sleep(3)
         except Exception as e:
             logger.error(f"Error while interacting with team stats button: {e}")
 
@@ -171,7 +281,6 @@ class ScrapeMatchData:
                 EC.presence_of_element_located((By.ID, "ui-id-3"))
             )
             a_elem.click()
-            time.sleep(3)
 
         except Exception as e:
             logger.error(f"Error while interacting with match events button: {e}")
@@ -0,0 +1,117 @@
+from playwright.async_api import async_playwright
+import asyncio
+import json
+import re
+import logging
+
+
+logging.basicConfig(level=logging.INFO, format="%(name)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# JSONP unwrapper. Format: TM3_..._callback({ ... })
+_JSONP_RE = re.compile(r"\((.*)\);?$", re.S)
+
+
+class ScrapeSquadsPW:
+    """
+    Scrape all squad information from opta using Playwright
+
+    One chromium process hosts every team page as a tab in the same
+    browser context, and `page.on("response")` hands over response
+    bodies directly — no performance-log parsing, no CDP round-trips,
+    no fixed sleeps. Tabs run concurrently under asyncio, bounded by
+    `max_tabs`.
+    ### Example:
+        ```
+        scraper = ScrapeSquadsPW(headless=True)
+        scraper.scrape()
+        # squad_data has the same shape as ScrapeSquads.squad_data
+        ```
+    """
+
+    def __init__(self, headless: bool = True, max_tabs: int = 5):
+        self.headless = headless
+        self.max_tabs = max_tabs
+        self.squad_data = {}
+
+    async def _capture_team(self, context, semaphore, team_name: str, url: str):
+        """Load one team page in its own tab and capture the squads feed"""
+        async with semaphore:
+            page = await context.new_page()
+            loop = asyncio.get_running_loop()
+            feed_response = loop.create_future()
+
+            def on_response(response):
+                if (
+                    "api.performfeeds.com" in response.url
+                    and "squads" in response.url
+                    and not feed_response.done()
+                ):
+                    feed_response.set_result(response)
+
+            page.on("response", on_response)
+            try:
+                await page.goto(url, wait_until="domcontentloaded")
+                response = await asyncio.wait_for(feed_response, timeout=10)
+                body = await response.body()
+
+                match = _JSONP_RE.search(body.decode("utf-8", "ignore").strip())
+                if match is None:
+                    logger.warning(f"Could not unwrap JSONP for {team_name}")
+                    return
+
+                squad_data = json.loads(match.group(1))
+                if "squad" in squad_data:
+                    self.squad_data[team_name] = squad_data["squad"]
+                    logger.info(f"Fetched {team_name}'s squad successfully...")
+                else:
+                    logger.warning(
+                        f"{team_name}'s squad_data doesn't contain key `squad`"
+                    )
+            except asyncio.TimeoutError:
+                logger.error(f"Timed out waiting for {team_name}'s squads feed")
+            except Exception as e:
+                logger.error(f"Error processing {team_name}: {e}")
+            finally:
+                await page.close()
+
+    async def _scrape_async(self, initial_page_to_load: str, initial_team_name: str):
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=self.headless)
+            context = await browser.new_context()
+            try:
+                semaphore = asyncio.Semaphore(self.max_tabs)
+
+                # First page: capture the initial team and read the team
+                # dropdown in one JS evaluation (links exist in the DOM
+                # without clicking the dropdown open)
+                page = await context.new_page()
+                await page.goto(initial_page_to_load, wait_until="domcontentloaded")
+                teams = await page.eval_on_selector_all(
+                    ".hub-navigation-dropdown-content-li a",
+                    "els => els.map(a => ({name: a.textContent.trim(), url: a.href}))",
+                )
+                await page.close()
+                logger.info(f"Found {len(teams)} teams in dropdown")
+
+                tasks = [
+                    self._capture_team(context, semaphore, team["name"], team["url"])
+                    for team in teams
+                ]
+                tasks.append(
+                    self._capture_team(
+                        context, semaphore, initial_team_name, initial_page_to_load
+                    )
+                )
+                await asyncio.gather(*tasks)
+            finally:
+                await browser.close()
+
+    def scrape(
+        self,
+        initial_page_to_load: str = "https://theanalyst.com/football/team/scm-1/manchester-united/squad",
+        initial_team_name: str = "Manchester United",
+    ):
+        logger.info(f"Starting squad scrape process...")
+        asyncio.run(self._scrape_async(initial_page_to_load, initial_team_name))
+        return self.squad_data
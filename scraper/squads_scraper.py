@@ -5,18 +5,64 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from typing import Literal
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, urljoin
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
 import json
 import time
-import base64
+import binascii
 import re
+import hashlib
 import logging
 import atexit
+import multiprocessing
+import httpx
+import lxml.html
+import orjson
 import pandas as pd
 
 
 logging.basicConfig(level=logging.INFO, format="%(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# JSONP unwrapper compiled once at import so the capture loop never
+# re-parses the pattern; operates on bytes — bodies are never decoded
+# to str. Format: TM3_..._callback({ ... })
+_JSONP_RE = re.compile(rb"\((.*)\);?\s*$", re.S)
+
+# Precise URL filter applied after a log entry passes the cheap
+# substring prefilter and gets JSON-decoded
+_SQUADS_URL_RE = re.compile(r"api\.performfeeds\.com.*squads")
+
+# Squad rosters change at most daily; same-day re-runs read from here
+# instead of hitting the network
+_CACHE_DIR = Path.home() / ".cache" / "squads"
+
+# In-page squads capture: wraps window.fetch so the feed is unwrapped
+# and parsed inside the browser and left on window.__squadsData (plus
+# the feed URL on window.__squadsUrl for the direct-HTTP fast path)
+_FETCH_HOOK_JS = """
+    const _fetch = window.fetch;
+    window.fetch = async (...args) => {
+        const response = await _fetch(...args);
+        const url = '' + args[0];
+        if (url.includes('api.performfeeds.com')
+                && url.includes('squads')) {
+            try {
+                const text = await response.clone().text();
+                const lp = text.indexOf('(');
+                const rp = text.lastIndexOf(')');
+                const payload = (lp !== -1 && rp > lp)
+                    ? text.slice(lp + 1, rp) : text;
+                window.__squadsData = JSON.parse(payload);
+                window.__squadsUrl = url;
+            } catch (e) {}
+        }
+        return response;
+    };
+"""
+
 
 def dismiss_cookie_banner(driver: webdriver.Chrome):
     """Dismiss the Usercentrics cookie banner"""
@@ -30,7 +76,13 @@ def dismiss_cookie_banner(driver: webdriver.Chrome):
             """
         )
         logger.info("Cookie banner dismissed")
-        time.sleep(1)
+        # Wait for the banner to actually leave the page rather than a
+        # fixed second; polls at 100ms and returns as soon as it is gone
+        WebDriverWait(driver, 5).until(
+            EC.invisibility_of_element_located(
+                (By.CSS_SELECTOR, "aside#usercentrics-cmp-ui")
+            )
+        )
         return True
     except Exception as e:
         logger.error(f"Could not dismiss cookie banner: {e}")
@@ -49,6 +101,11 @@ class ScrapeSquads:
         ```
     """
 
+    # Live drivers keyed by (headless, chrome_exe). Each Chrome launch
+    # costs ~1s and hundreds of MB; repeat constructions rebind to the
+    # cached session instead of spawning a fresh browser
+    _driver_cache = {}
+
     def __init__(
         self, headless: bool = True, chrome_exe: str = "/opt/homebrew/bin/chromedriver"
     ):
@@ -61,13 +118,38 @@ class ScrapeSquads:
         :param chrome_exe: Description
         :type chrome_exe: str
         """
-        service = Service(chrome_exe)
+        self._headless = headless
+        self._chrome_exe = chrome_exe
+        # Full squads feed URL sniffed from the first Selenium capture;
+        # once known, the remaining teams are fetched over plain HTTP
+        self._squad_feed_url = None
+
+        cached = self._driver_cache.get((headless, chrome_exe))
+        if cached is not None and cached.session_id:
+            # Remote sessions have no local service process to probe
+            service = getattr(cached, "service", None)
+            if service is None or service.is_connectable():
+                logger.info("Reusing cached Chrome session")
+                self.driver = cached
+                return
 
         opts = Options()
+        # Return from driver.get at DOMContentLoaded instead of the full
+        # load event: the squads XHR fires well before every tracker ping
+        # finishes, and the capture loop waits for it explicitly anyway
+        opts.page_load_strategy = "eager"
         opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        # Only Network.* frames are consumed; leaving traceCategories
+        # empty keeps Chrome from dumping tracing events into the log
+        # that the Python scan would then have to wade through
         opts.add_experimental_option(
             "perfLoggingPrefs",
-            {"enableNetwork": True, "enablePage": False, "traceCategories": "network"},
+            {
+                "enableNetwork": True,
+                "enablePage": False,
+                "enableTimeline": False,
+                "traceCategories": "",
+            },
         )
         opts.add_argument("--start-maximized")
         if headless is True:
@@ -77,73 +159,242 @@ class ScrapeSquads:
             logger.info("Starting squad scraper in chrome browser")
         opts.add_experimental_option("excludeSwitches", ["enable-logging"])
         opts.add_argument("--log-level=3")
+        # Belt-and-braces with the CDP block list below: stop Chrome
+        # from even requesting images
+        opts.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+
+        if chrome_exe is None:
+            # Attach to an already-running chromedriver (started once,
+            # e.g. `chromedriver --port=9515 &`). Each attach gets its
+            # own browser session but shares the driver process, so
+            # worker pools skip its per-process startup and RSS
+            self.driver = webdriver.Remote(
+                command_executor="http://127.0.0.1:9515", options=opts
+            )
+        else:
+            self.driver = webdriver.Chrome(
+                service=Service(chrome_exe), options=opts
+            )
+
+        # Only the squads JSONP and the page's JS matter; block heavy
+        # static assets and trackers so each team page moves far fewer
+        # bytes. JS stays enabled — it triggers the feed request
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd(
+            "Network.setBlockedURLs",
+            {
+                "urls": [
+                    "*.png",
+                    "*.jpg",
+                    "*.jpeg",
+                    "*.gif",
+                    "*.webp",
+                    "*.svg",
+                    "*.woff",
+                    "*.woff2",
+                    "*.ttf",
+                    "*.mp4",
+                    "*googletagmanager.com*",
+                    "*google-analytics.com*",
+                ]
+            },
+        )
+
+        self._install_fetch_hook()
 
+        ScrapeSquads._driver_cache[(headless, chrome_exe)] = self.driver
+        # Registered only when a driver is actually created, so the
+        # cached session gets exactly one shutdown hook
         atexit.register(self.close_webdriver)
-        self.driver = webdriver.Chrome(service=service, options=opts)
 
-    def capture_squad_api(self):
-        """Capture and parse the PerformFeeds squad API response"""
-        try:
-            # Wait for performance logs to be populated
-            time.sleep(3)
+    def _fetch_all_squads_http(self):
+        """
+        Fetch the whole-tournament squads feed directly over HTTP
 
-            logs = self.driver.get_log("performance")
+        The feed URL captured from the first page load carries a `ctst`
+        (contestant) query parameter. Dropping it makes PerformFeeds
+        return every contestant in the tournament in a single response,
+        so one GET replaces a browser navigation per team. Asking for
+        `_fmt=json` also skips the JSONP callback wrapper.
+        """
+        if self._squad_feed_url is None:
+            return None
 
-            for entry in logs:
-                try:
-                    msg = json.loads(entry["message"])
-                    message = msg.get("message", {})
-                    params = message.get("params", {})
-
-                    if message.get("method") == "Network.responseReceived":
-                        response = params.get("response", {})
-                        request_id = params.get("requestId")
-                        url = response.get("url", "")
-
-                        # Filter for PerformFeeds squad API
-                        if "api.performfeeds.com" in url and "squads" in url:
-                            status = response.get("status")
-
-                            if status == 200:
-                                # Get response body
-                                try:
-                                    body_info = self.driver.execute_cdp_cmd(
-                                        "Network.getResponseBody",
-                                        {"requestId": request_id},
-                                    )
-
-                                    body = body_info.get("body", "")
-                                    is_base64 = body_info.get("base64Encoded", False)
-
-                                    # Decode if base64
-                                    if is_base64:
-                                        body = base64.b64decode(body).decode(
-                                            "utf-8", errors="ignore"
-                                        )
-
-                                    # Parse JSONP response
-                                    # Format: TM3_..._callback({ ... })
-                                    match = re.search(r"\((.*)\);?$", body.strip())
-
-                                    if match:
-                                        json_str = match.group(1)
-                                        squad_data = json.loads(json_str)
-
-                                        return squad_data
-
-                                except Exception as e:
-                                    logger.error(f"Error processing response: {e}")
-                                    continue
-
-                except Exception:
-                    continue
+        scheme, netloc, path, query, fragment = urlsplit(self._squad_feed_url)
+        params = {
+            k: v
+            for k, v in parse_qsl(query)
+            if k not in ("ctst", "_clbk")
+        }
+        params["_fmt"] = "json"
+        url = urlunsplit((scheme, netloc, path, urlencode(params), fragment))
 
+        try:
+            # Plain HTTP/1.1: this is a single GET, and http2=True would
+            # raise ImportError without the optional h2 extra installed,
+            # silently disabling the fast path
+            with httpx.Client(timeout=15.0) as client:
+                response = client.get(url)
+                response.raise_for_status()
+                raw = response.text.strip()
+                # Defensive: unwrap JSONP if the server ignored _fmt=json
+                if not raw.startswith("{"):
+                    match = re.search(r"\((.*)\);?$", raw)
+                    if not match:
+                        return None
+                    raw = match.group(1)
+                return json.loads(raw)
+        except Exception as e:
+            logger.error(f"Direct squads feed fetch failed: {e}")
             return None
 
+    def _install_fetch_hook(self):
+        """
+        Install the in-page squads capture on the current target
+
+        The common capture case then becomes one execute_script
+        round-trip — no log scan, no CDP body fetch, no base64. The
+        performance-log pipeline stays as the fallback in case the site
+        loads the feed through a <script> JSONP tag, which fetch never
+        sees. Page.addScriptToEvaluateOnNewDocument only applies to the
+        target it is issued on, so every scripted tab needs its own
+        call before it navigates.
+        """
+        self.driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": _FETCH_HOOK_JS}
+        )
+
+    def capture_squad_api(self, timeout: float = 10.0):
+        """
+        Capture and parse the PerformFeeds squad API response
+
+        Polls the performance log until a matching 200 response appears
+        instead of sleeping a fixed 3 seconds. get_log drains Chrome's
+        buffer, so each iteration only scans entries that arrived since
+        the previous one — the wait tracks actual feed latency (usually
+        well under a second) with a hard deadline as the ceiling.
+        """
+        try:
+            deadline = time.monotonic() + timeout
+            while True:
+                # Fast path: the fetch hook installed in __init__ may
+                # already hold the parsed feed for this document
+                hooked = self.driver.execute_script(
+                    "return window.__squadsData"
+                    " ? [window.__squadsData, window.__squadsUrl] : null"
+                )
+                if hooked:
+                    squad_data, url = hooked
+                    if url:
+                        # Keep the HTTP fast path fed even when the log
+                        # scan below never runs
+                        self._squad_feed_url = url
+                    return squad_data
+
+                request_ids = self._scan_for_squad_requests(
+                    self.driver.get_log("performance")
+                )
+
+                if request_ids:
+                    squad_data = self._fetch_bodies(request_ids)
+                    if squad_data is not None:
+                        return squad_data
+
+                if time.monotonic() >= deadline:
+                    logger.warning("Timed out waiting for squads response")
+                    return None
+                time.sleep(0.05)
+
         except Exception as e:
             logger.error(f"Error capturing squads API: {e}")
             return None
 
+    def _scan_for_squad_requests(self, logs) -> list:
+        """Collect requestIds of squads-feed 200 responses from the log"""
+        request_ids = []
+        for entry in logs:
+            try:
+                raw = entry["message"]
+                # Most entries are requestWillBeSent/dataReceived chatter
+                # for unrelated hosts; two C-level substring checks reject
+                # them before any JSON decoding
+                if "api.performfeeds.com" not in raw or "squads" not in raw:
+                    continue
+                msg = orjson.loads(raw)
+                message = msg.get("message", {})
+                params = message.get("params", {})
+
+                if message.get("method") == "Network.responseReceived":
+                    response = params.get("response", {})
+                    url = response.get("url", "")
+
+                    # Filter for PerformFeeds squad API
+                    if _SQUADS_URL_RE.search(url):
+                        if response.get("status") == 200:
+                            # Remember the feed URL so later teams can
+                            # be fetched directly over HTTP
+                            self._squad_feed_url = url
+                            request_ids.append(params.get("requestId"))
+
+            except Exception:
+                continue
+        return request_ids
+
+    def _fetch_bodies(self, request_ids: list):
+        """
+        Fetch the matched bodies concurrently and return the first parse
+
+        A page can trigger several squads-matching requests, and each
+        Network.getResponseBody is a synchronous chromedriver RPC;
+        overlapping the calls hides the per-call round-trip latency.
+        """
+        with ThreadPoolExecutor(max_workers=len(request_ids)) as ex:
+            futures = [
+                ex.submit(
+                    self.driver.execute_cdp_cmd,
+                    "Network.getResponseBody",
+                    {"requestId": request_id},
+                )
+                for request_id in request_ids
+            ]
+            for future in futures:
+                try:
+                    squad_data = self._parse_jsonp_body(future.result())
+                    if squad_data is not None:
+                        return squad_data
+                except Exception as e:
+                    logger.error(f"Error processing response: {e}")
+        return None
+
+    def _parse_jsonp_body(self, body_info: dict):
+        """Decode a CDP response body and unwrap its JSONP payload"""
+        body = body_info.get("body", "")
+
+        # Work on bytes end-to-end: orjson accepts them directly, so
+        # base64 bodies skip the utf-8 decode and its full-buffer copy
+        if body_info.get("base64Encoded", False):
+            raw = binascii.a2b_base64(body)
+        elif isinstance(body, str):
+            raw = body.encode()
+        else:
+            raw = body
+
+        # Slicing between the first '(' and last ')' is O(n) with no
+        # regex backtracking or strip copy
+        lp = raw.find(b"(")
+        rp = raw.rfind(b")")
+        if lp != -1 and rp > lp:
+            payload = raw[lp + 1 : rp]
+        else:
+            match = _JSONP_RE.search(raw)
+            payload = match.group(1) if match else None
+
+        if payload:
+            return orjson.loads(payload)
+        return None
+
     def click_dropdown(self):
         """Click on the team dropdown button"""
         try:
@@ -155,15 +406,57 @@ class ScrapeSquads:
             self.driver.execute_script(
                 "arguments[0].scrollIntoView(true);", dropdown_btn
             )
-            time.sleep(0.5)
             dropdown_btn.click()
             logger.info("Teams dropdown clicked")
-            time.sleep(1)
+            # Wait for the dropdown content itself instead of sleeping;
+            # get_team_links re-checks presence but by then it is free
+            WebDriverWait(self.driver, 5).until(
+                EC.presence_of_element_located(
+                    (By.CLASS_NAME, "hub-navigation-dropdown-content-li")
+                )
+            )
             return True
         except Exception as e:
             logger.error(f"Error while opening teams dropdown: {e}")
             return False
 
+    @staticmethod
+    def get_team_links_static(page_url: str):
+        """
+        Extract the team dropdown from the page's static HTML
+
+        The dropdown markup is server-rendered, so one GET plus an lxml
+        parse replaces the click simulation, its waits and the WebDriver
+        round-trips. Returns [] when the fragment is missing (e.g. the
+        page switched to JS rendering); callers then fall back to the
+        browser-driven path.
+        """
+        try:
+            html = httpx.get(
+                page_url,
+                headers={"User-Agent": "Mozilla/5.0"},
+                follow_redirects=True,
+                timeout=10.0,
+            ).text
+            doc = lxml.html.fromstring(html)
+            anchors = doc.xpath(
+                "//*[contains(concat(' ', normalize-space(@class), ' '),"
+                " ' hub-navigation-dropdown-content-li ')]//a"
+            )
+            teams = [
+                {
+                    "name": a.text_content().strip(),
+                    "url": urljoin(page_url, a.get("href")),
+                }
+                for a in anchors
+                if a.get("href")
+            ]
+            logger.info(f"Found {len(teams)} teams in static HTML")
+            return teams
+        except Exception as e:
+            logger.error(f"Static team-list fetch failed: {e}")
+            return []
+
     def get_team_links(self):
         """Get all team links from dropdown"""
         try:
@@ -174,23 +467,21 @@ class ScrapeSquads:
                 )
             )
 
-            # Get all team links
-            dropdown_items = self.driver.find_elements(
-                By.CLASS_NAME, "hub-navigation-dropdown-content-li"
+            # One JS evaluation returns the whole list. The old loop did
+            # find_element + get_attribute + text per item — three
+            # WebDriver round-trips each, ~60 for a 20-team dropdown.
+            # The selector requires an <a>, so the currently selected
+            # entry (which has none) filters itself out
+            teams = self.driver.execute_script(
+                """
+                return Array.from(
+                    document.querySelectorAll(
+                        '.hub-navigation-dropdown-content-li a'
+                    )
+                ).map(a => ({name: a.textContent.trim(), url: a.href}));
+                """
             )
 
-            teams = []
-            for item in dropdown_items:
-                try:
-                    # Skip the selected item which doesn't have an <a> tag
-                    link_elem = item.find_element(By.TAG_NAME, "a")
-                    href = link_elem.get_attribute("href")
-                    team_name = link_elem.text.strip()
-                    teams.append({"name": team_name, "url": href})
-                except:
-                    # This is the currently selected team
-                    pass
-
             logger.info(f"Found {len(teams)} teams in dropdown")
             return teams
 
@@ -199,70 +490,241 @@ class ScrapeSquads:
             return []
 
     def close_webdriver(self):
+        # Drop the shutdown hook so an explicit close isn't replayed
+        # against the dead service at interpreter exit
+        atexit.unregister(self.close_webdriver)
+        self._driver_cache.pop((self._headless, self._chrome_exe), None)
         self.driver.quit()
 
     def scrape(
         self,
         initial_page_to_load: str = "https://theanalyst.com/football/team/scm-1/manchester-united/squad",
         initial_team_name: str = "Manchester United",
+        workers: int = None,
+        out_path: str = None,
     ):
         all_teams_data = {}
+        # With out_path set, each squad is streamed to NDJSON as it is
+        # fetched instead of accumulating in RAM — partial results also
+        # survive a mid-run crash
+        self._out_fh = open(out_path, "wb") if out_path else None
+        try:
+            self._scrape(all_teams_data, initial_page_to_load, initial_team_name, workers)
+        finally:
+            if self._out_fh is not None:
+                self._out_fh.close()
+                self._out_fh = None
+        self.squad_data = all_teams_data
+
+    def _record_team(self, store: dict, team_name: str, squad):
+        """Accumulate a squad in memory, or stream it when out_path is set"""
+        if self._out_fh is not None:
+            self._out_fh.write(
+                orjson.dumps({"team": team_name, "squad": squad}) + b"\n"
+            )
+        else:
+            store[team_name] = squad
+
+    def _scrape(
+        self,
+        all_teams_data: dict,
+        initial_page_to_load: str,
+        initial_team_name: str,
+        workers: int,
+    ):
         logger.info(f"Starting squad scrape process...")
         logger.info(f"Loading page {initial_page_to_load}")
 
+        # With page_load_strategy="eager", get() returns at
+        # DOMContentLoaded — all the cookie banner and dropdown need
         self.driver.get(initial_page_to_load)
 
-        time.sleep(2)
-
         dismiss_cookie_banner(self.driver)
 
+        # capture_squad_api returns None on timeout; without the guard a
+        # single missed feed used to abort the whole run with a TypeError
         squad_data = self.capture_squad_api()
-        if "squad" in squad_data:
-            all_teams_data[initial_team_name] = squad_data["squad"]
+        if squad_data and "squad" in squad_data:
+            self._record_team(all_teams_data, initial_team_name, squad_data["squad"])
             logger.info(f"Fetched {initial_team_name}'s squad successfully...")
         else:
             logger.warning(f"squad_data doesn't contain key `squad`")
 
-        # pprint.pprint(all_teams_data)
-        if not self.click_dropdown():
-            logger.error(f"Could not click on on teams dropdown")
+        # Fast path: with the feed URL sniffed above, one HTTP GET for
+        # the whole tournament replaces a browser navigation per team
+        tournament_data = self._fetch_all_squads_http()
+        if tournament_data and len(tournament_data.get("squad", [])) > 1:
+            for contestant in tournament_data["squad"]:
+                team_name = contestant.get("contestantName", contestant.get("contestantId"))
+                self._record_team(all_teams_data, team_name, [contestant])
+                logger.info(f"Fetched {team_name}'s squad successfully...")
             return
 
-        teams = self.get_team_links()
+        # Static HTML first: no click simulation, no waits. Only drive
+        # the dropdown in the browser if the fragment is JS-rendered
+        teams = self.get_team_links_static(initial_page_to_load)
+        if not teams:
+            if not self.click_dropdown():
+                logger.error(f"Could not click on on teams dropdown")
+                return
+
+            teams = self.get_team_links()
         if not teams or len(teams) == 0:
             logger.error(f"No teams found in dropdown!")
             return
 
-        for idx, team in enumerate(teams, 1):
-            try:
-                team_name = team["name"]
-                team_url = team["url"]
-
-                logger.info(f"[{idx}/{len(teams)}] Processing: {team_name}")
-                logger.info(f"  URL: {team_url}")
-
-                # Navigate to team page
-                self.driver.get(team_url)
-                time.sleep(2)
-
-                squad_data = self.capture_squad_api()
-                if "squad" in squad_data:
-                    all_teams_data[team_name] = squad_data["squad"]
-                    logger.info(f"Fetched {team_name}'s squad successfully...")
-                else:
-                    logger.warning(
-                        f"{team_name}'s squad_data doesn't contain key `squad`"
+        if workers and workers > 1 and len(teams) > 1:
+            chunk_results = self._scrape_teams_parallel(teams, workers)
+            for team_name, squad in chunk_results.items():
+                self._record_team(all_teams_data, team_name, squad)
+        else:
+            self._scrape_teams_tabbed(teams, all_teams_data)
+
+    def _scrape_teams_tabbed(self, teams, store: dict, batch_size: int = 5):
+        """
+        Scrape teams in batches of concurrently loading tabs
+
+        window.open kicks off every navigation in the batch at once, so
+        page loads overlap instead of running back to back, and the
+        site's shared JS bundle comes out of Chrome's cache for every
+        tab after the first. Capture then visits each tab in turn and
+        closes it. Results go through _record_team, so they stream to
+        NDJSON when an out_path was given.
+        """
+        root_handle = self.driver.current_window_handle
+
+        for start in range(0, len(teams), batch_size):
+            batch = []
+            self.driver.switch_to.window(root_handle)
+
+            for team in teams[start : start + batch_size]:
+                cache_path = self._cache_path(team["url"])
+                if cache_path.exists():
+                    logger.info(f"Using cached squad for {team['name']}")
+                    self._record_team(
+                        store, team["name"], json.loads(cache_path.read_text())
                     )
-            except Exception as e:
-                logger.error(f"Error processing {team_name}: {e}")
-                continue
-        self.squad_data = all_teams_data
+                    continue
+
+                known = set(self.driver.window_handles)
+                self.driver.execute_script("window.open('about:blank', '_blank');")
+                new_handle = (set(self.driver.window_handles) - known).pop()
+
+                # The fetch hook from __init__ only covers the root
+                # target, so install it on the fresh tab first, then
+                # kick off the navigation via location.href — which
+                # doesn't block — so the rest of the batch keeps opening
+                self.driver.switch_to.window(new_handle)
+                self._install_fetch_hook()
+                self.driver.execute_script(
+                    "window.location.href = arguments[0];", team["url"]
+                )
+                self.driver.switch_to.window(root_handle)
+                batch.append((team, new_handle))
+
+            for idx, (team, handle) in enumerate(batch, start + 1):
+                team_name = team["name"]
+                try:
+                    logger.info(f"[{idx}/{len(teams)}] Processing: {team_name}")
+                    self.driver.switch_to.window(handle)
+
+                    squad_data = self.capture_squad_api()
+                    if squad_data and "squad" in squad_data:
+                        self._record_team(store, team_name, squad_data["squad"])
+                        self._store_in_cache(team["url"], squad_data["squad"])
+                        logger.info(f"Fetched {team_name}'s squad successfully...")
+                    else:
+                        logger.warning(
+                            f"{team_name}'s squad_data doesn't contain key `squad`"
+                        )
+                except Exception as e:
+                    logger.error(f"Error processing {team_name}: {e}")
+                finally:
+                    try:
+                        self.driver.close()
+                    except Exception:
+                        pass
+
+        self.driver.switch_to.window(root_handle)
+
+    @staticmethod
+    def _cache_path(team_url: str) -> Path:
+        key = hashlib.sha1(
+            f"{team_url}|{date.today().isoformat()}".encode()
+        ).hexdigest()
+        return _CACHE_DIR / f"{key}.json"
+
+    @classmethod
+    def _store_in_cache(cls, team_url: str, squad):
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cls._cache_path(team_url).write_text(json.dumps(squad))
+        except OSError as e:
+            logger.warning(f"Could not cache squad for {team_url}: {e}")
+
+    def scrape_team(self, team_name: str, team_url: str):
+        """Navigate to one team page and capture its squad"""
+        # Cache hit skips the navigation (and its wait) entirely; the
+        # key includes today's date so stale rosters age out overnight
+        cache_path = self._cache_path(team_url)
+        if cache_path.exists():
+            logger.info(f"Using cached squad for {team_name}")
+            return json.loads(cache_path.read_text())
+
+        self.driver.get(team_url)
+
+        # No settle sleep needed: capture_squad_api polls until the feed
+        # response actually lands
+        squad_data = self.capture_squad_api()
+        if squad_data and "squad" in squad_data:
+            logger.info(f"Fetched {team_name}'s squad successfully...")
+            squad = squad_data["squad"]
+            self._store_in_cache(team_url, squad)
+            return squad
+        logger.warning(f"{team_name}'s squad_data doesn't contain key `squad`")
+        return None
+
+    def _scrape_teams_parallel(self, teams, workers: int):
+        """
+        Scrape team chunks across a pool of worker processes
+
+        Selenium is not thread-safe, so each worker process owns its own
+        ScrapeSquads (one chromedriver per process) created once in the
+        pool initializer and reused for the whole chunk. Wall time for
+        the team loop drops near-linearly with the pool size.
+        """
+        workers = min(workers, len(teams))
+        chunks = [teams[i::workers] for i in range(workers)]
+        logger.info(f"Scraping {len(teams)} teams across {workers} workers")
+
+        with multiprocessing.Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(self._headless, self._chrome_exe),
+        ) as pool:
+            results = pool.map(_scrape_team_list, chunks)
+
+        merged = {}
+        for chunk_result in results:
+            merged.update(chunk_result)
+        return merged
+
+    def _iter_squads(self, ndjson_path: str = None):
+        """Yield (team_name, squad) pairs from memory or an NDJSON file"""
+        if ndjson_path is not None:
+            with open(ndjson_path, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        record = orjson.loads(line)
+                        yield record["team"], record["squad"]
+        else:
+            yield from self.squad_data.items()
 
-    def filter_team_data(self):
+    def filter_team_data(self, ndjson_path: str = None):
         self.all_players = []
         logger.info("Filtering player data..")
 
-        for team_name, squad_object in self.squad_data.items():
+        for team_name, squad_object in self._iter_squads(ndjson_path):
             try:
 
                 team_object = squad_object[0]
@@ -314,6 +776,47 @@ class ScrapeSquads:
             return pd.DataFrame(self.all_players)
 
 
+# One ScrapeSquads per worker process; created in the pool initializer
+# and reused across the worker's whole chunk so Chrome startup is paid
+# once per process, not once per team
+_WORKER_SCRAPER = None
+
+
+def _init_worker(headless: bool, chrome_exe: str):
+    global _WORKER_SCRAPER
+    # Under the fork start method the worker inherits the parent's
+    # _driver_cache, whose key matches and whose chromedriver port is
+    # still connectable — every worker would silently rebind to the
+    # parent's one browser and race it. Start from an empty cache so
+    # each worker launches its own Chrome
+    ScrapeSquads._driver_cache.clear()
+    _WORKER_SCRAPER = ScrapeSquads(headless=headless, chrome_exe=chrome_exe)
+
+
+def _scrape_team_list(teams):
+    """Scrape a chunk of teams with this worker's own driver"""
+    results = {}
+    try:
+        for team in teams:
+            try:
+                squad = _WORKER_SCRAPER.scrape_team(team["name"], team["url"])
+                if squad is not None:
+                    results[team["name"]] = squad
+            except Exception as e:
+                logger.error(f"Error processing {team['name']}: {e}")
+                continue
+    finally:
+        # Pool workers exit via os._exit and never run atexit handlers,
+        # so the driver has to be torn down here. Each worker receives
+        # exactly one chunk (the pool maps one chunk per worker), making
+        # this the end of the worker's useful life
+        try:
+            _WORKER_SCRAPER.close_webdriver()
+        except Exception as e:
+            logger.error(f"Error closing worker driver: {e}")
+    return results
+
+
 if __name__ == "__main__":
     scraper = ScrapeSquads(headless=True)
     scraper.scrape()